@@ -1,11 +1,97 @@
 import click
-import pandas as pd
+import functools
+import json
 from rich.table import Table
 from rich.status import Status
-from rich.syntax import Syntax
 from rich.text import Text
-from config import config as app_config # To get GOOGLE_GEMINI_API_KEY
-from .utils import get_handler_and_console, CONTEXT_SETTINGS, RichHelpFormatter # Import RichHelpFormatter
+from ..core.config_cache import load_config # To get GOOGLE_GEMINI_API_KEY
+from .utils import get_handler_and_console, map_concurrently, CONTEXT_SETTINGS, RichHelpFormatter # Import RichHelpFormatter
+
+# Engines that need an 'api_key' USING parameter
+_API_KEY_ENGINES = frozenset({'openai', 'anthropic', 'google_gemini'})
+
+# Columns shown by list-models/describe-model, in display order (as returned by `SHOW MODELS` / `DESCRIBE`)
+_MODEL_DISPLAY_COLS = ('NAME', 'ENGINE', 'PROJECT', 'ACTIVE', 'STATUS', 'PREDICT', 'UPDATE_STATUS', 'TRAINING_OPTIONS')
+# Long model columns pre-truncated (vectorized) to this many characters, so Rich never measures the full text
+_TRUNCATED_MODEL_COLS = ('TRAINING_OPTIONS',)
+_TRUNCATE_WIDTH = 50
+# Result tables above this many rows drop the per-row rules and use a lighter box, which Rich renders much faster
+_COMPACT_TABLE_ROWS = 50
+# Default cap on rows rendered by `ai query` (the full result is still fetched; --stream output is never capped)
+_MAX_RENDER_ROWS = 500
+# Key column names used by key/value shaped DESCRIBE output, paired with a 'value' column
+_DESCRIBE_KEY_COLS = ('column', 'attribute', 'type')
+
+@functools.cache
+def _gemini_key():
+    # Config doesn't change while the process runs, so resolve it once (matters in daemon mode)
+    return getattr(load_config(), 'GOOGLE_GEMINI_API_KEY', None)
+
+@functools.lru_cache(maxsize=64)
+def _highlighted_sql(query_string, width, color_system):
+    """The query echo as pre-rendered Segments. Rich re-runs the Pygments lexer every time a Syntax is printed,
+    so the rendered lines are cached instead; repeats in interactive or daemon mode skip lexing entirely.
+    Keyed on the output's shape rather than a Console, since the daemon builds a new Console per request."""
+    from rich.console import Console
+    from rich.segment import Segments
+    from rich.syntax import Syntax # Deferred: pulls in pygments, which only the query echo needs
+    syntax = Syntax(query_string, "sql", theme="dracula", line_numbers=True)
+    render_console = Console(width=width, color_system=color_system) # Throwaway: only its render options are used
+    return Segments(list(render_console.render(syntax, render_console.options)))
+
+def _resolve_project(ctx, console, project_name):
+    """Returns --project-name or the connected project's name, printing an error if neither is available."""
+    effective_project_name = project_name or ctx.obj.default_project_name
+    if not effective_project_name:
+        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
+    return effective_project_name
+
+# Upper bound on concurrent MindsDB requests for the multi-model commands (they share the handler's pooled session)
+_MAX_MODEL_WORKERS = 8
+
+def _result_table(row_count, **table_options):
+    """Returns a Table styled for row_count rows: ruled rows for small results, a compact box for large ones."""
+    from rich import box
+    compact = row_count > _COMPACT_TABLE_ROWS
+    return Table(show_header=True, header_style="bold magenta", show_lines=not compact,
+                 box=box.SIMPLE if compact else box.HEAVY_HEAD, **table_options)
+
+def _render_columns(df):
+    """Returns the _MODEL_DISPLAY_COLS present in df, in display order, via a single Index.intersection call."""
+    import pandas as pd # Already loaded by the time a DataFrame exists
+    return pd.Index(_MODEL_DISPLAY_COLS).intersection(df.columns, sort=False).tolist()
+
+def _missing_columns_note(render_columns, what):
+    """One note line naming every _MODEL_DISPLAY_COLS entry that isn't being rendered, or None if all are."""
+    missing = [col for col in _MODEL_DISPLAY_COLS if col not in render_columns]
+    if not missing: return None
+    return f"[yellow]Note: {what} {', '.join(repr(col) for col in missing)} not found. {'It' if len(missing) == 1 else 'They'} will not be displayed.[/yellow]"
+
+def _table_rows(df, columns=None, truncate=()):
+    """Yields a DataFrame's rows as tuples of strings for Table.add_row, with missing values as "".
+
+    Cells are stringified column-wise in one vectorized pass and rows come from itertuples as plain tuples,
+    ready to splat into add_row, instead of boxing every row into a Series (as iterrows does) and calling
+    str() per cell. Columns named in `truncate` are cut to _TRUNCATE_WIDTH characters with a trailing ellipsis.
+    """
+    frame = (df.reindex(columns=columns) if columns else df).fillna("").astype(str)
+    for col in truncate:
+        if col in frame.columns:
+            text = frame[col]
+            frame[col] = text.where(text.str.len() <= _TRUNCATE_WIDTH, text.str.slice(0, _TRUNCATE_WIDTH - 1) + '…')
+    return frame.itertuples(index=False, name=None)
+
+def _write_records(df, output_format, out, header=True):
+    """Writes a DataFrame to a text stream as TSV or as JSON Lines (one object per row), using pandas' C formatters."""
+    if output_format == 'json':
+        records = df.to_json(orient='records', lines=True, date_format='iso')
+        out.write(records if records.endswith('\n') or not records else records + '\n')
+    else:
+        df.to_csv(out, sep='\t', header=header, index=False)
+
+def _stream_tsv(df, columns=None):
+    """Writes a DataFrame to stdout as tab-separated rows, without building a Rich table or a full formatted string."""
+    (df[columns] if columns else df).to_csv(click.get_text_stream('stdout'), sep='\t', index=False)
 
 @click.group('ai', context_settings=CONTEXT_SETTINGS)
 def ai_group():
@@ -27,9 +113,10 @@ ai_group.formatter_class = RichHelpFormatter # Set formatter for this group
 @click.option('--predict-column', required=True, help="Name of the column the AI Model should learn to predict or generate.")
 @click.option('--engine', default='openai', show_default=True, help="AI engine to use (e.g., 'openai', 'google_gemini', 'anthropic', 'ollama'). Check MindsDB docs for available engines.")
 @click.option('--prompt-template', default=None, help="Prompt template for the AI Model. Use {{column_name}} for placeholders from your --select-data-query. E.g., 'Summarize: {{text_column}}'.")
+@click.option('--params-json', default=None, help="All additional `USING` parameters as one JSON object, or '@path' to read it from a file. E.g., '{\"model_name\": \"gpt-4\", \"temperature\": 0.2}'. --param values override keys set here.")
 @click.option('--param', 'additional_params', multiple=True, type=(str, str), help="Additional `USING` parameters as key-value pairs. Can be specified multiple times. E.g., --param model_name gpt-3.5-turbo --param api_key YOUR_API_KEY.")
 @click.pass_context
-def ai_create_model(ctx, model_name, project_name, select_data_query, predict_column, engine, prompt_template, additional_params):
+def ai_create_model(ctx, model_name, project_name, select_data_query, predict_column, engine, prompt_template, params_json, additional_params):
     """
     Creates an AI Model (Generative AI Table) by training it on data from a SELECT query.
 
@@ -42,6 +129,7 @@ def ai_create_model(ctx, model_name, project_name, select_data_query, predict_co
     --engine: Specifies the underlying LLM or ML engine.
     --prompt-template: Guides the model's generation process. Use {{column_name}} for features.
     --param: Allows passing engine-specific parameters like API keys, model variants (e.g., 'gpt-4'), temperature, etc.
+    --params-json: Passes many parameters at once as a JSON object (or '@file.json'). Applied before --param, so --param wins on conflicts.
 
     Examples:
 
@@ -50,29 +138,38 @@ def ai_create_model(ctx, model_name, project_name, select_data_query, predict_co
 
       Create a sentiment classifier using Google Gemini:
       `kleos ai create-model review_sentiment --select-data-query "SELECT review, sentiment FROM my_reviews.data" --predict-column sentiment --engine google_gemini --prompt-template "Classify sentiment: {{review}}" --param api_key YOUR_GOOGLE_KEY`
+
+      Create a model with engine parameters kept in a JSON file:
+      `kleos ai create-model news_summarizer --select-data-query "SELECT article_text FROM news_data.articles" --predict-column summary --params-json @openai_params.json`
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name
-    if not effective_project_name:
-        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
-        return
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
 
     using_params = {'engine': engine}
     if prompt_template: using_params['prompt_template'] = prompt_template
-    if engine == 'google_gemini' and 'api_key' not in dict(additional_params):
-        gemini_api_key = app_config.GOOGLE_GEMINI_API_KEY
+    if params_json:
+        try:
+            if params_json.startswith('@'):
+                with open(params_json[1:], encoding='utf-8') as f: params_json = f.read()
+            parsed_params = json.loads(params_json)
+            if not isinstance(parsed_params, dict): raise ValueError("--params-json must be a JSON dictionary.")
+        except Exception as e: console.print(f"[red]Invalid JSON in --params-json: {e}[/red]"); return
+        using_params.update(parsed_params)
+    using_params.update(additional_params) # Click's (str, str) pairs feed dict.update directly
+    if engine in _API_KEY_ENGINES and 'api_key' not in using_params: # One membership check covers both the fallback and the warning
+        gemini_api_key = _gemini_key() if engine == 'google_gemini' else None
         if gemini_api_key: using_params['api_key'] = gemini_api_key
-        else: console.print(f"[yellow]Warning: Engine is '{engine}' but GOOGLE_GEMINI_API_KEY not found in config and not provided via --param api_key.[/yellow]")
-    for key, value in additional_params: using_params[key] = value
-    if engine in ['openai', 'anthropic', 'google_gemini'] and 'api_key' not in using_params:
-         console.print(f"[yellow]Warning: Engine '{engine}' typically requires an 'api_key'. Provide via --param api_key or ensure in config.[/yellow]")
+        elif engine == 'google_gemini': console.print(f"[yellow]Warning: Engine is '{engine}' but GOOGLE_GEMINI_API_KEY not found in config and not provided via --param api_key.[/yellow]")
+        else: console.print(f"[yellow]Warning: Engine '{engine}' typically requires an 'api_key'. Provide via --param api_key or ensure in config.[/yellow]")
 
-    console.print(f"Creating AI Model '[cyan]{model_name}[/cyan]' in project '[cyan]{effective_project_name}[/cyan]'...")
-    console.print(Text.assemble(("  Training data query: ", "dim"), (select_data_query, "italic")))
-    console.print(Text.assemble(("  Predicting column: ", "dim"), (predict_column, "italic")))
-    console.print(Text.assemble(("  Using parameters: ", "dim"), (str(using_params), "italic")))
+    if not ctx.obj.quiet:
+        console.print(f"Creating AI Model '[cyan]{model_name}[/cyan]' in project '[cyan]{effective_project_name}[/cyan]'...")
+        console.print(Text.assemble(("  Training data query: ", "dim"), (select_data_query, "italic")))
+        console.print(Text.assemble(("  Predicting column: ", "dim"), (predict_column, "italic")))
+        console.print(Text.assemble(("  Using parameters: ", "dim"), (str(using_params), "italic")))
 
     with Status(f"Initiating AI Model '[cyan]{model_name}[/cyan]' creation...", console=console, spinner="dots"):
         success = handler.create_model_from_query(
@@ -81,78 +178,55 @@ def ai_create_model(ctx, model_name, project_name, select_data_query, predict_co
         )
     if success:
         console.print(f"[green]:heavy_check_mark: AI Model '[cyan]{model_name}[/cyan]' creation process initiated or model already exists.[/green]")
-        console.print(f"[dim]Training/generation may take time. Use 'kleos ai list-models --project-name {effective_project_name}' and 'kleos ai describe-model {model_name} --project-name {effective_project_name}' to check status.[/dim]")
+        if not ctx.obj.quiet: console.print(f"[dim]Training/generation may take time. Use 'kleos ai list-models --project-name {effective_project_name}' and 'kleos ai describe-model {model_name} --project-name {effective_project_name}' to check status.[/dim]")
     else:
         console.print(f"[red]:x: Failed to initiate creation for AI Model '[cyan]{model_name}[/cyan]'.[/red]")
 
 @ai_group.command('list-models')
 @click.option('--project-name', default=None, help="MindsDB project from which to list models. Defaults to the currently connected project.")
+@click.option('--no-cache', is_flag=True, help="Always query MindsDB instead of reusing a listing fetched in the last 30 seconds.")
 @click.pass_context
-def ai_list_models(ctx, project_name):
+def ai_list_models(ctx, project_name, no_cache):
     """
     Lists all AI Models within a specified MindsDB project.
 
     Displays key information: NAME, ENGINE, PROJECT, ACTIVE, STATUS, PREDICT,
     UPDATE_STATUS, and TRAINING_OPTIONS.
     The table will use the full console width.
+
+    Listings are reused for 30 seconds within a session (e.g. the daemon), and
+    a fresh listing also answers `describe-model` without another round trip.
+    Pass --no-cache to force a fresh lookup.
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name
-    if not effective_project_name:
-        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
-        return
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
 
     with Status(f"Fetching AI Models from project '[cyan]{effective_project_name}[/cyan]'...", console=console):
         # Assuming handler.list_models() returns a DataFrame with columns like:
         # 'name', 'engine', 'project_name', 'active', 'status', 'predict' (target column),
         # 'update_status', 'training_options_json' (or similar for training_options)
-        models_df = handler.list_models(project_name=effective_project_name)
+        models_df = handler.list_models(project_name=effective_project_name, use_cache=not no_cache)
 
     if models_df is not None and not models_df.empty:
-        console.print(f"\n[bold green]AI Models in Project '[cyan]{effective_project_name}[/cyan]':[/bold green]")
+        actual_df_columns_to_render = _render_columns(models_df)
+        if not console.is_terminal:
+            # Piped output: stream rows as TSV instead of building a Rich table
+            _stream_tsv(models_df, actual_df_columns_to_render)
+            return
 
-        # Define the exact columns to display and their user-friendly headers.
-        # The keys are the expected column names from models_df (adjust if handler.list_models() returns different names).
-        # The values are the headers to display in the table.
-        # Example: 'name' from df becomes 'NAME' in table.
-        # These are based on the user request: NAME, ENGINE, PROJECT, ACTIVE, STATUS, PREDICT, UPDATE_STATUS, TRAINING_OPTIONS
-        # Assuming MindsDB `SHOW MODELS` output columns are lowercase with underscores.
-        display_columns_map = {
-            'NAME': 'NAME',
-            'ENGINE': 'ENGINE',
-            'PROJECT': 'PROJECT',
-            'ACTIVE': 'ACTIVE',
-            'STATUS': 'STATUS',
-            'PREDICT': 'PREDICT',
-            'STATUS': 'STATUS',
-            'TRAINING_OPTIONS': 'TRAINING_OPTIONS'
-        }
+        console.print(f"\n[bold green]AI Models in Project '[cyan]{effective_project_name}[/cyan]':[/bold green]")
 
         # Create table. `expand=True` helps in utilizing full width when possible.
         # `box=box.ROUNDED` for a nicer look.
-        table = Table(show_header=True, header_style="bold magenta", show_lines=True,
-                      title=f"AI Models in Project '[cyan]{effective_project_name}[/cyan]'",
-                      expand=True)
-
-        actual_df_columns_to_render = []
-
-        for df_col, display_header in display_columns_map.items():
-            if df_col in models_df.columns:
-                col_options = {}
-                if df_col == 'training_options': # Keep training_options potentially truncated as it can be very long
-                    col_options['max_width'] = 50
-                    col_options['overflow'] = 'ellipsis'
+        table = _result_table(len(models_df), title=f"AI Models in Project '[cyan]{effective_project_name}[/cyan]'", expand=True)
 
-                # For other columns, let Rich manage width by not setting max_width, allowing them to expand.
-                # Rich's `expand=True` on Table and no width on Column helps.
-                table.add_column(display_header, **col_options)
-                actual_df_columns_to_render.append(df_col)
-            else:
-                # If a specifically requested column is missing in the DataFrame,
-                # we could add it with a note or skip. For now, skipping.
-                console.print(f"[yellow]Note: Column '{df_col}' (for '{display_header}') not found in model data. It will not be displayed.[/yellow]")
+        # Let Rich manage widths (`expand=True`, no max_width); long TRAINING_OPTIONS are pre-truncated in _table_rows
+        for df_col in actual_df_columns_to_render: table.add_column(df_col)
+        missing_note = _missing_columns_note(actual_df_columns_to_render, "Model data columns") # Requested columns missing from the DataFrame are skipped
+        if missing_note: console.print(missing_note)
 
         if not actual_df_columns_to_render:
             console.print("[red]Error: None of the requested columns were found in the model data. Cannot display table.[/red]")
@@ -169,16 +243,7 @@ def ai_list_models(ctx, project_name):
 
         # Only proceed to add rows if there are columns to render
         if actual_df_columns_to_render:
-            for _, row in models_df.iterrows():
-                row_data = []
-                for df_col_name in actual_df_columns_to_render:
-                    cell_value = row.get(df_col_name)
-                    # Ensure training_options (or any complex object) is nicely stringified for the table
-                    if df_col_name == 'training_options' and not isinstance(cell_value, str):
-                        cell_value = str(cell_value)
-                    else:
-                        cell_value = str(cell_value) if cell_value is not None else ""
-                    row_data.append(cell_value)
+            for row_data in _table_rows(models_df, actual_df_columns_to_render, truncate=_TRUNCATED_MODEL_COLS):
                 table.add_row(*row_data)
 
             if table.columns:
@@ -195,73 +260,63 @@ def ai_list_models(ctx, project_name):
 @ai_group.command('describe-model')
 @click.argument('model_name')
 @click.option('--project-name', default=None, help="MindsDB project where the model resides. Defaults to the currently connected project.")
+@click.option('--no-cache', is_flag=True, help="Always query MindsDB instead of reusing a result fetched in the last few seconds.")
 @click.pass_context
-def ai_describe_model(ctx, model_name, project_name):
+def ai_describe_model(ctx, model_name, project_name, no_cache):
     """
     Shows detailed information for a specific AI Model in a table format.
 
     Displays: NAME, ENGINE, PROJECT, ACTIVE, STATUS, PREDICT, UPDATE_STATUS,
     and TRAINING_OPTIONS. The table uses the full console width.
+
+    Results are reused for a few seconds, so polling a training model's status
+    (e.g. through the daemon) doesn't re-query MindsDB on every call. Pass
+    --no-cache to force a fresh lookup.
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name
-    if not effective_project_name:
-        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
-        return
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
 
     with Status(f"Fetching details for AI Model '[cyan]{model_name}[/cyan]' in project '[cyan]{effective_project_name}[/cyan]'...", console=console):
-        # We expect handler.describe_model to return a DataFrame for the single model,
-        # containing the necessary columns, similar to a filtered `list_models` result.
-        # If handler.describe_model returns the old format (key-value pairs), this will need adjustment
-        # in the handler itself, or here by fetching all models and filtering.
-        # For now, proceeding with the assumption it returns a one-row DataFrame with relevant columns.
-        model_df = handler.describe_model(model_name=model_name, project_name=effective_project_name)
+        # handler.describe_model filters by name server-side (information_schema.models), so this is the
+        # single model's row; older servers answer DESCRIBE with key/value rows, handled below.
+        model_df = handler.describe_model(model_name=model_name, project_name=effective_project_name, use_cache=not no_cache)
 
     if model_df is not None and not model_df.empty:
-        # Ensure we're dealing with a single model's data, possibly by taking the first row
-        # if describe_model by chance returns more (e.g. if it internally used list_models without exact name filter)
-        if len(model_df) > 1:
-            # If more than one model is returned by describe_model for a specific name, it's unexpected.
-            # We'll take the first one that matches the name, or just the first one.
-            # A more robust handler.describe_model should ensure only one model's data is returned.
-            console.print(f"[yellow]Warning: describe-model returned multiple entries for '{model_name}'. Displaying the first one.[/yellow]")
-            # Attempt to find an exact name match if multiple rows are returned
-            exact_match_df = model_df[model_df['name'].str.lower() == model_name.lower()]
-            if not exact_match_df.empty:
-                model_df = exact_match_df.head(1)
-            else:
-                model_df = model_df.head(1) # Fallback to first row if no exact name match (e.g. due to case)
+        # Key/value shaped output (e.g. `column`/`value` rows) is listed pair by pair. The column pair is detected
+        # once up front, and the rows come from zipping the two column arrays rather than iterating Series rows.
+        lower_cols = {str(col).lower(): col for col in model_df.columns}
+        key_col = next((lower_cols[name] for name in _DESCRIBE_KEY_COLS if name in lower_cols), None)
+        if key_col is not None and 'value' in lower_cols and not any(col in model_df.columns for col in _MODEL_DISPLAY_COLS):
+            if not console.is_terminal:
+                _stream_tsv(model_df, [key_col, lower_cols['value']])
+                return
+            console.print(f"\n[bold green]Details for AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]':[/bold green]")
+            kv_table = Table(show_header=False, box=None)
+            kv_table.add_column("Property", style="dim")
+            kv_table.add_column("Value")
+            for key, value in zip(model_df[key_col].to_numpy(), model_df[lower_cols['value']].to_numpy()):
+                kv_table.add_row(str(key), str(value))
+            console.print(kv_table)
+            return
 
-        console.print(f"\n[bold green]Details for AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]':[/bold green]")
+        actual_df_columns_to_render = _render_columns(model_df)
+        if not console.is_terminal:
+            # Piped output: stream rows as TSV instead of building a Rich table
+            _stream_tsv(model_df, actual_df_columns_to_render)
+            return
 
-        display_columns_map = {
-            'NAME': 'NAME',
-            'ENGINE': 'ENGINE',
-            'PROJECT': 'PROJECT',
-            'ACTIVE': 'ACTIVE',
-            'STATUS': 'STATUS',
-            'PREDICT': 'PREDICT',
-            'STATUS': 'STATUS',
-            'TRAINING_OPTIONS': 'TRAINING_OPTIONS'
-        }
+        console.print(f"\n[bold green]Details for AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]':[/bold green]")
 
         table = Table(show_header=True, header_style="bold magenta", show_lines=True,
                       title=f"Details for AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]'",
                       expand=True)
 
-        actual_df_columns_to_render = []
-        for df_col, display_header in display_columns_map.items():
-            if df_col in model_df.columns:
-                col_options = {}
-                if df_col == 'training_options':
-                    col_options['max_width'] = 50
-                    col_options['overflow'] = 'ellipsis'
-                table.add_column(display_header, **col_options)
-                actual_df_columns_to_render.append(df_col)
-            else:
-                console.print(f"[yellow]Note: Detail '{df_col}' (for '{display_header}') not found for this model. It will not be displayed.[/yellow]")
+        for df_col in actual_df_columns_to_render: table.add_column(df_col)
+        missing_note = _missing_columns_note(actual_df_columns_to_render, "Model details")
+        if missing_note: console.print(missing_note)
 
         if not actual_df_columns_to_render:
             console.print(f"[red]Error: None of the requested details were found for model '{model_name}'.[/red]")
@@ -272,25 +327,15 @@ def ai_describe_model(ctx, model_name, project_name):
                 kv_table = Table(show_header=False, box=None)
                 kv_table.add_column("Property", style="dim")
                 kv_table.add_column("Value")
-                first_row = model_df.iloc[0]
-                for col_name, value in first_row.items():
+                for col_name, value in zip(model_df.columns, model_df.iloc[0].tolist()):
                     kv_table.add_row(str(col_name), str(value))
                 console.print(kv_table)
             return
 
         # Add the single row of model data
         if actual_df_columns_to_render and not model_df.empty:
-            # model_df should contain one row after the logic above
-            row_data_series = model_df.iloc[0]
-            row_values = []
-            for df_col_name in actual_df_columns_to_render:
-                cell_value = row_data_series.get(df_col_name)
-                if df_col_name == 'training_options' and not isinstance(cell_value, str):
-                    cell_value = str(cell_value)
-                else:
-                    cell_value = str(cell_value) if cell_value is not None else ""
-                row_values.append(cell_value)
-            table.add_row(*row_values)
+            # describe_model returns the single matching row; head(1) guards against older servers
+            table.add_row(*next(_table_rows(model_df.head(1), actual_df_columns_to_render, truncate=_TRUNCATED_MODEL_COLS)))
 
             if table.columns:
                 console.print(table)
@@ -319,10 +364,8 @@ def ai_drop_model(ctx, model_name, project_name):
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name
-    if not effective_project_name:
-        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
-        return
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
 
     with Status(f"Attempting to drop AI Model '[cyan]{model_name}[/cyan]' from project '[cyan]{effective_project_name}[/cyan]'...", console=console):
         success = handler.drop_model(model_name=model_name, project_name=effective_project_name)
@@ -347,25 +390,107 @@ def ai_refresh_model(ctx, model_name, project_name):
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name
-    if not effective_project_name:
-        console.print("[red]:x: Could not determine MindsDB project. Please connect or specify --project-name.[/red]")
-        return
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
 
     with Status(f"Attempting to refresh AI Model '[cyan]{model_name}[/cyan]' in project '[cyan]{effective_project_name}[/cyan]'...", console=console):
         success = handler.refresh_model(model_name=model_name, project_name=effective_project_name)
 
     if success:
         console.print(f"[green]:heavy_check_mark: AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]' refresh process initiated successfully.[/green]")
-        console.print(f"[dim]Retraining may take time. Use 'kleos ai describe-model {model_name} --project-name {effective_project_name}' to check status.[/dim]")
+        if not ctx.obj.quiet: console.print(f"[dim]Retraining may take time. Use 'kleos ai describe-model {model_name} --project-name {effective_project_name}' to check status.[/dim]")
     else:
         console.print(f"[red]:x: Failed to initiate refresh for AI Model '[cyan]{effective_project_name}.{model_name}[/cyan]'.[/red]")
 
+@ai_group.command('drop-models')
+@click.argument('model_names', nargs=-1, required=True)
+@click.option('--project-name', default=None, help="MindsDB project where the models reside. Defaults to the currently connected project.")
+@click.confirmation_option(prompt='Are you sure you want to drop these AI Models? This action is irreversible.')
+@click.pass_context
+def ai_drop_models(ctx, model_names, project_name):
+    """
+    Drops (deletes) several AI Models at once.
+
+    The DROP statements are sent concurrently, so dropping N models takes roughly
+    as long as dropping one. Results are reported as each drop completes.
+
+    Example:
+    `kleos ai drop-models old_summarizer old_classifier test_model --yes`
+    """
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
+
+    failed = 0
+    with Status(f"Dropping {len(model_names)} AI Model(s) from project '[cyan]{effective_project_name}[/cyan]'...", console=console):
+        drop = functools.partial(handler.drop_model, project_name=effective_project_name)
+        for model_name, success in map_concurrently(drop, model_names, _MAX_MODEL_WORKERS):
+            if success:
+                console.print(f"[green]:heavy_check_mark: {model_name}: dropped successfully or did not exist.[/green]")
+            else:
+                failed += 1
+                console.print(f"[red]:x: {model_name}: failed to drop.[/red]")
+    if failed:
+        ctx.exit(1)
+
+@ai_group.command('describe-models')
+@click.argument('model_names', nargs=-1, required=True)
+@click.option('--project-name', default=None, help="MindsDB project where the models reside. Defaults to the currently connected project.")
+@click.option('--no-cache', is_flag=True, help="Always query MindsDB instead of reusing results fetched in the last few seconds.")
+@click.pass_context
+def ai_describe_models(ctx, model_names, project_name, no_cache):
+    """
+    Shows a one-row summary per AI Model for several models at once.
+
+    The DESCRIBE statements are sent concurrently; rows appear in the order the
+    lookups complete.
+
+    Example:
+    `kleos ai describe-models news_summarizer sentiment_classifier`
+    """
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    effective_project_name = _resolve_project(ctx, console, project_name)
+    if not effective_project_name: return
+
+    rows = []
+    with Status(f"Describing {len(model_names)} AI Model(s) in project '[cyan]{effective_project_name}[/cyan]'...", console=console):
+        describe = functools.partial(handler.describe_model, project_name=effective_project_name, use_cache=not no_cache)
+        for model_name, model_df in map_concurrently(describe, model_names, _MAX_MODEL_WORKERS):
+            if model_df is None:
+                console.print(f"[red]:x: {model_name}: failed to describe.[/red]")
+            elif model_df.empty:
+                console.print(f"[yellow]{model_name}: no description found. It might not exist.[/yellow]")
+            else:
+                row = next(_table_rows(model_df.head(1), _MODEL_DISPLAY_COLS, truncate=_TRUNCATED_MODEL_COLS))
+                rows.append((model_name,) + row[1:]) # NAME column: always the name that was asked for
+
+    if not rows:
+        return
+    if not console.is_terminal:
+        out = click.get_text_stream('stdout')
+        out.write('\t'.join(_MODEL_DISPLAY_COLS) + '\n')
+        out.writelines('\t'.join(row) + '\n' for row in rows)
+        return
+    table = Table(show_header=True, header_style="bold magenta", show_lines=True,
+                  title=f"AI Models in Project '[cyan]{effective_project_name}[/cyan]'", expand=True)
+    for col in _MODEL_DISPLAY_COLS: table.add_column(col)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
 @ai_group.command('query')
 @click.argument('query_string', type=str) # Removed help, will be in docstring
 @click.option('--project-name', default=None, help="MindsDB project context for the query. Defaults to the currently connected project.")
+@click.option('--stream', is_flag=True, help="Fetch the result in pages and print rows as they arrive (a live table, or TSV/JSON lines per --format), instead of all at the end. Only queries with an ORDER BY are paged.")
+@click.option('--chunk-size', default=500, show_default=True, type=click.IntRange(min=1), help="Rows fetched per page with --stream.")
+@click.option('--limit', default=_MAX_RENDER_ROWS, show_default=True, type=click.IntRange(min=0), help="Maximum number of rows to render in the result table (0 = no limit). --stream and tsv/json output are not capped.")
+@click.option('--format', 'output_format', type=click.Choice(['auto', 'table', 'tsv', 'json']), default='auto', show_default=True, help="Output format. 'auto' renders a table on a terminal and TSV when piped; 'json' writes one JSON object per row.")
 @click.pass_context
-def ai_query(ctx, query_string, project_name):
+def ai_query(ctx, query_string, project_name, stream, chunk_size, limit, output_format):
     """
     Executes an arbitrary SQL query against the MindsDB project.
 
@@ -379,35 +504,152 @@ def ai_query(ctx, query_string, project_name):
 
     Directly querying a model that takes input via WHERE clause:
     `kleos ai query "SELECT * FROM mindsdb.my_translator_model WHERE text_to_translate = 'Hello world' AND target_language = 'Spanish'"`
+
+    Streaming a large result as TSV, 1000 rows per page (memory stays bounded):
+    `kleos -q ai query "SELECT * FROM news.articles ORDER BY id" --stream --chunk-size 1000 > articles.tsv`
+
+    Writing rows as JSON Lines for another tool:
+    `kleos ai query "SELECT * FROM news.articles LIMIT 100" --format json | jq .title`
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project_name = project_name if project_name else handler.project.name if handler.project else "default"
+    default_project_name = ctx.obj.default_project_name
+    effective_project_name = project_name or default_project_name or "default"
 
-    if project_name and handler.project and project_name != handler.project.name:
-        console.print(f"[yellow]Warning: Query will be executed in the context of the connected project ('{handler.project.name}'). "
+    if project_name and default_project_name and project_name != default_project_name:
+        console.print(f"[yellow]Warning: Query will be executed in the context of the connected project ('{default_project_name}'). "
                       f"Ensure your query string correctly references objects if they are in '{project_name}'.[/yellow]")
 
-    console.print(f"Executing query in project '[cyan]{effective_project_name}[/cyan]':")
-    console.print(Syntax(query_string, "sql", theme="dracula", line_numbers=True))
+    if output_format == 'auto':
+        output_format = 'table' if console.is_terminal else 'tsv'
+    as_table = output_format == 'table'
+
+    if not ctx.obj.quiet and as_table: # Machine-readable output carries only the rows
+        console.print(f"Executing query in project '[cyan]{effective_project_name}[/cyan]':")
+        console.print(_highlighted_sql(query_string, console.width, console.color_system))
+
+    if stream:
+        # Each page is rendered as soon as it arrives and then dropped: as a table its rows are appended to a
+        # Live table, otherwise they're written and flushed as TSV/JSON. No DataFrame for the full result is ever built.
+        rows_written = 0
+        try:
+            if as_table:
+                from rich.live import Live
+                table = Table(show_header=True, header_style="bold magenta", show_lines=True)
+                with Live(table, console=console, refresh_per_second=4, vertical_overflow="visible"):
+                    for chunk_df in handler.execute_sql_iter(query_string, chunk_size=chunk_size):
+                        if not table.columns:
+                            for col in chunk_df.columns: table.add_column(str(col))
+                        for row_data in _table_rows(chunk_df):
+                            table.add_row(*row_data)
+                        rows_written += len(chunk_df)
+            else:
+                out = click.get_text_stream('stdout')
+                for chunk_df in handler.execute_sql_iter(query_string, chunk_size=chunk_size):
+                    _write_records(chunk_df, output_format, out, header=rows_written == 0)
+                    out.flush()
+                    rows_written += len(chunk_df)
+        except Exception as e:
+            console.print(f"[red]:x: Error executing query: {str(e)}[/red]")
+            return
+        if rows_written == 0 and as_table:
+            console.print("[yellow]Query executed successfully but returned no data.[/yellow]")
+        return
 
     with Status("Executing query...", console=console, spinner="aesthetic"):
         try:
-            result_df = handler.execute_sql(query_string)
+            result_df = handler.execute_sql(query_string, suppress_messages=not as_table)
         except Exception as e:
             console.print(f"[red]:x: Error executing query: {str(e)}[/red]")
             return
 
-    if result_df is not None:
+    if result_df is not None and not as_table:
+        # Fast path for scripts: pandas' C formatters write the rows directly, skipping Rich's per-cell measurement
+        _write_records(result_df, output_format, click.get_text_stream('stdout'))
+    elif result_df is not None:
         if not result_df.empty:
             console.print("\n[bold green]Query Result:[/bold green]")
-            table = Table(show_header=True, header_style="bold magenta", show_lines=True)
+            total_rows = len(result_df)
+            shown_df = result_df.head(limit) if limit and total_rows > limit else result_df
+            table = _result_table(len(shown_df))
             for col in result_df.columns: table.add_column(col)
-            for _, row in result_df.iterrows():
-                table.add_row(*(str(x) for x in row))
+            for row_data in _table_rows(shown_df):
+                table.add_row(*row_data)
             console.print(table)
+            if len(shown_df) < total_rows:
+                console.print(f"[dim](showing {len(shown_df)} of {total_rows} rows; use --limit 0 to show all)[/dim]")
         else:
             console.print("[yellow]Query executed successfully but returned no data.[/yellow]")
     else: # Should not happen if execute_sql raises on failure, but as a safeguard
         console.print("[red]:x: Query execution failed to return results.[/red]")
+
+async def _gather_queries(handler, queries, concurrency):
+    """Runs each query on a worker thread, with at most `concurrency` in flight. Failures are returned, not raised."""
+    import asyncio
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(query):
+        async with semaphore:
+            return await asyncio.to_thread(handler.execute_sql, query, True)
+
+    return await asyncio.gather(*(run_one(query) for query in queries), return_exceptions=True)
+
+@ai_group.command('query-batch')
+@click.argument('query_file', type=click.File('r', encoding='utf-8'))
+@click.option('--concurrency', default=16, show_default=True, type=click.IntRange(min=1), help="Maximum number of queries in flight at once. Keep it at or below MINDSDB_POOL_SIZE and the AI engine's rate limit.")
+@click.pass_context
+def ai_query_batch(ctx, query_file, concurrency):
+    """
+    Executes many SQL queries concurrently, one query per line of QUERY_FILE.
+
+    Useful for scripted inference against LLM-backed models, where each query
+    spends most of its time waiting on the network and the model. Blank lines
+    and lines starting with `--` are skipped; pass `-` to read from stdin.
+    Results are combined into one table with a `query` column giving the
+    (1-based) query number (`_query` if the results already have a `query` column).
+
+    Example:
+    `kleos ai query-batch questions.sql --concurrency 8`
+    """
+    import asyncio
+    import pandas as pd
+
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    queries = [line.strip() for line in query_file if line.strip() and not line.lstrip().startswith('--')]
+    if not queries:
+        console.print("[yellow]No queries found in the input.[/yellow]")
+        return
+
+    with Status(f"Executing {len(queries)} queries (up to {concurrency} at a time)...", console=console, spinner="aesthetic"):
+        results = asyncio.run(_gather_queries(handler, queries, concurrency))
+
+    frames, failed = {}, 0
+    for query_number, result in enumerate(results, start=1):
+        if isinstance(result, Exception):
+            failed += 1
+            console.print(f"[red]:x: Query {query_number} failed: {str(result)}[/red]")
+        elif result is not None and not result.empty:
+            frames[query_number] = result
+
+    if frames:
+        number_col = 'query'
+        result_columns = set().union(*(frame.columns for frame in frames.values()))
+        while number_col in result_columns: # e.g. SELECT query, answer FROM my_agent
+            number_col = f"_{number_col}"
+        result_df = pd.concat(frames, names=[number_col]).reset_index(level=number_col).reset_index(drop=True)
+        if not console.is_terminal:
+            _stream_tsv(result_df)
+        else:
+            console.print(f"\n[bold green]Batch Result ({len(queries) - failed}/{len(queries)} queries succeeded):[/bold green]")
+            table = Table(show_header=True, header_style="bold magenta", show_lines=True)
+            for col in result_df.columns: table.add_column(str(col))
+            for row_data in _table_rows(result_df):
+                table.add_row(*row_data)
+            console.print(table)
+    elif not failed:
+        console.print("[yellow]All queries executed successfully but returned no data.[/yellow]")
+    if failed:
+        ctx.exit(1)
@@ -0,0 +1,247 @@
+import click
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+from contextlib import redirect_stdout, redirect_stderr
+from .utils import CONTEXT_SETTINGS, RichHelpFormatter
+
+DAEMON_SOCKET_PATH = os.path.expanduser('~/.kleos.sock')
+
+# Every message on the socket is a frame: 1-byte kind + 4-byte payload length + payload.
+# Client -> daemon: b'a' (JSON request). Daemon -> client: b'o' (stdout), b'e' (stderr), b'x' (exit code).
+_FRAME_HEADER = struct.Struct('!cI')
+
+def _send_frame(sock_file, kind: bytes, payload: bytes):
+    sock_file.write(_FRAME_HEADER.pack(kind, len(payload)) + payload)
+    sock_file.flush()
+
+def _recv_frame(sock_file):
+    header = sock_file.read(_FRAME_HEADER.size)
+    if len(header) < _FRAME_HEADER.size:
+        return None, None
+    kind, length = _FRAME_HEADER.unpack(header)
+    return kind, sock_file.read(length)
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that streams every write back to the client as a frame."""
+    def __init__(self, sock_file, kind: bytes):
+        self._sock_file = sock_file
+        self._kind = kind
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if text:
+            # click.echo hands over bytes when it can't find a binary buffer behind the stream
+            _send_frame(self._sock_file, self._kind, text if isinstance(text, (bytes, bytearray)) else text.encode('utf-8'))
+        return len(text)
+
+def _client_terminal() -> dict:
+    """Describes this process's stdout terminal, so the daemon can render forwarded output the same way."""
+    from rich.console import Console
+    client_console = Console()
+    return {'is_terminal': client_console.is_terminal, 'width': client_console.width,
+            'height': client_console.height, 'color_system': client_console.color_system}
+
+def _request_console(terminal):
+    """Console for one forwarded command, matching the client's terminal (the daemon's own stdout is /dev/null or a socket)."""
+    from rich.console import Console
+    terminal = terminal or {}
+    if not terminal.get('is_terminal'):
+        return Console(force_terminal=False)
+    return Console(force_terminal=True, width=terminal.get('width'), height=terminal.get('height'),
+                   color_system=terminal.get('color_system'))
+
+def _dispatch(argv, lazy_handler, sock_file, terminal=None) -> int:
+    from src.main import cli, _split_global_options # Imported here to avoid a circular import with main's lazy groups
+
+    _, command_args = _split_global_options(argv)
+    if command_args[:1] == ['daemon']: # Would call back into this single-threaded server and deadlock
+        _send_frame(sock_file, b'e', b"Error: 'daemon' commands can't be run inside the daemon.\n")
+        return 1
+
+    # Requests are served one at a time, so the shared handler can borrow this request's console
+    shared_console = lazy_handler.console
+    lazy_handler.console = _request_console(terminal)
+    try:
+        return _run_cli(cli, argv, lazy_handler, sock_file)
+    finally:
+        lazy_handler.console = shared_console # Also resets a handler that connected during this request
+
+def _run_cli(cli, argv, lazy_handler, sock_file) -> int:
+    with redirect_stdout(_FrameWriter(sock_file, b'o')), redirect_stderr(_FrameWriter(sock_file, b'e')):
+        try:
+            rv = cli.main(args=argv, prog_name="kleos", standalone_mode=False, obj=lazy_handler)
+            return rv if isinstance(rv, int) else 0
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.ClickException as e:
+            e.show(file=sys.stderr)
+            return e.exit_code
+        except click.exceptions.Abort:
+            click.echo("Aborted!", err=True)
+            return 1
+        except Exception as e:
+            click.echo(f"Error: {str(e)}", err=True)
+            return 1
+
+def _peer_is_owner(connection) -> bool:
+    """Checks that the connecting process runs as this user, where the platform reports peer credentials."""
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return True # The 0600 socket file is the only guard here
+    _, uid, _ = struct.unpack('3i', connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+    return uid == os.getuid()
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        if not _peer_is_owner(self.connection):
+            return
+        kind, payload = _recv_frame(self.rfile)
+        if kind != b'a':
+            return
+        request = json.loads(payload)
+        if request.get('op') == 'stop':
+            _send_frame(self.wfile, b'x', b'0')
+            threading.Thread(target=self.server.shutdown).start() # shutdown() blocks, so it can't run on the serving thread
+            return
+        exit_code = 0 # 'ping' and unknown ops just report liveness
+        if request.get('op') == 'run':
+            exit_code = _dispatch(request.get('argv', []), self.server.lazy_handler, self.wfile, request.get('terminal'))
+        _send_frame(self.wfile, b'x', str(exit_code).encode())
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _KleosDaemonServer(socketserver.UnixStreamServer):
+        # Requests are served one at a time: commands share a single console and MindsDB handler.
+        def __init__(self, socket_path, lazy_handler):
+            self.lazy_handler = lazy_handler
+            super().__init__(socket_path, _DaemonRequestHandler)
+else:
+    _KleosDaemonServer = None
+
+def _reload_config(signum=None, frame=None):
+    """SIGHUP handler: drops cached configuration so the next command re-reads config/config.py."""
+    from ..core.config_cache import load_config
+    load_config.cache_clear()
+    ai_commands = sys.modules.get('src.commands.ai_commands') # Only clear what has actually been imported
+    if ai_commands is not None:
+        ai_commands._gemini_key.cache_clear()
+    kb_commands = sys.modules.get('src.commands.kb_commands')
+    if kb_commands is not None:
+        kb_commands._ollama_base_url.cache_clear()
+
+def _send_request(request: dict):
+    """Sends a request to the daemon, streaming its output to this process. Returns the exit code, or None if no daemon is listening."""
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(DAEMON_SOCKET_PATH):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(DAEMON_SOCKET_PATH)
+    except OSError:
+        sock.close()
+        return None
+    with sock, sock.makefile('rwb') as sock_file:
+        _send_frame(sock_file, b'a', json.dumps(request).encode('utf-8'))
+        while True:
+            kind, payload = _recv_frame(sock_file)
+            if kind is None:
+                return 1 # Daemon went away mid-request
+            if kind == b'o':
+                sys.stdout.write(payload.decode('utf-8')); sys.stdout.flush()
+            elif kind == b'e':
+                sys.stderr.write(payload.decode('utf-8')); sys.stderr.flush()
+            elif kind == b'x':
+                return int(payload)
+
+def run_via_daemon(argv):
+    """Forwards a kleos command line to a running daemon. Returns its exit code, or None if no daemon is listening."""
+    return _send_request({'op': 'run', 'argv': list(argv), 'terminal': _client_terminal()})
+
+@click.group('daemon', context_settings=CONTEXT_SETTINGS)
+def daemon_group():
+    """Commands for running Kleos as a long-lived background daemon.
+
+    The daemon keeps the Python process, its imports, and one MindsDB connection
+    alive between commands. Run any command with `kleos --via-daemon ...` to forward
+    it to the daemon over a local socket instead of starting from scratch.
+    """
+    pass
+
+daemon_group.formatter_class = RichHelpFormatter # Set formatter for this group
+
+@daemon_group.command('start')
+@click.option('--foreground', is_flag=True, help="Run the daemon in the current process instead of forking into the background.")
+@click.pass_context
+def daemon_start(ctx, foreground):
+    """
+    Starts the Kleos daemon listening on `~/.kleos.sock`.
+
+    Commands forwarded with `--via-daemon` run inside the daemon and reuse its
+    MindsDB connection. Interactive prompts (e.g. drop confirmations) cannot be
+    answered through the daemon, so pass `--yes` to those commands.
+
+    Send the daemon SIGHUP after editing config/config.py to make it re-read
+    cached settings such as API keys; connection settings need a restart.
+
+    Example:
+    `kleos daemon start` then `kleos --via-daemon ai list-models`
+    """
+    console = ctx.obj.console
+    if _KleosDaemonServer is None:
+        console.print("[red]:x: Daemon mode requires Unix domain sockets, which are not available on this platform.[/red]")
+        return
+
+    if os.path.exists(DAEMON_SOCKET_PATH):
+        if _send_request({'op': 'ping'}) is not None:
+            console.print(f"[yellow]Kleos daemon is already running on '[cyan]{DAEMON_SOCKET_PATH}[/cyan]'.[/yellow]")
+            return
+        os.unlink(DAEMON_SOCKET_PATH) # Stale socket from a daemon that didn't shut down cleanly
+
+    previous_umask = os.umask(0o077) # The socket is created owner-only, so no other user can connect to it
+    try:
+        server = _KleosDaemonServer(DAEMON_SOCKET_PATH, ctx.obj)
+    finally:
+        os.umask(previous_umask)
+
+    if not foreground and hasattr(os, 'fork'):
+        if os.fork() > 0:
+            server.socket.close()
+            console.print(f"[green]:heavy_check_mark: Kleos daemon started on '[cyan]{DAEMON_SOCKET_PATH}[/cyan]'.[/green]")
+            console.print("[dim]Stop it with 'kleos daemon stop'.[/dim]")
+            return
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+    else:
+        console.print(f"[green]Kleos daemon listening on '[cyan]{DAEMON_SOCKET_PATH}[/cyan]'. Press Ctrl+C to stop.[/green]")
+
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, _reload_config)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(DAEMON_SOCKET_PATH):
+            os.unlink(DAEMON_SOCKET_PATH)
+    if not foreground and hasattr(os, 'fork'):
+        os._exit(0) # Forked child: never return into the parent's Click machinery
+
+@daemon_group.command('stop')
+@click.pass_context
+def daemon_stop(ctx):
+    """Stops a running Kleos daemon."""
+    console = ctx.obj.console
+    if _send_request({'op': 'stop'}) is None:
+        console.print("[yellow]No Kleos daemon is running.[/yellow]")
+    else:
+        console.print("[green]:heavy_check_mark: Kleos daemon stopped.[/green]")
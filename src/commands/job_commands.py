@@ -1,10 +1,8 @@
 import click
-import pandas as pd
-from rich.table import Table
+import time
+from rich.table import Table # Already imported by .utils, so free here
 from rich.status import Status
-from rich.syntax import Syntax
-from rich.text import Text
-from .utils import get_handler_and_console, CONTEXT_SETTINGS, RichHelpFormatter # Import RichHelpFormatter
+from .utils import get_handler_and_console, map_concurrently, CONTEXT_SETTINGS, RichHelpFormatter # Import RichHelpFormatter
 
 @click.group('job', context_settings=CONTEXT_SETTINGS)
 def job_group():
@@ -18,7 +16,38 @@ def job_group():
 
 job_group.formatter_class = RichHelpFormatter # Set formatter for this group
 
-def _display_df_as_table(console, df, title=""):
+def common_project_option(help="MindsDB project where the job is located. Defaults to the currently connected project."):
+    """The shared --project option of the job commands: one definition for its name, default and help text."""
+    return click.option('--project', default=None, help=help)
+
+_CREATE_PROJECT_HELP = "MindsDB project where the job should be created. Defaults to the currently connected project."
+_MANY_PROJECT_HELP = "MindsDB project where the jobs are located. Defaults to the currently connected project."
+
+# Upper bound on concurrent MindsDB requests for drop-many (they share the handler's pooled session)
+_MAX_JOB_WORKERS = 16
+
+# Above this many rows, job output is printed as plain text: Rich measures every cell of a Table, which dominates
+# the run time for long listings such as `job history`
+_MAX_PRETTY_ROWS = 500
+
+def _resolve_project(ctx, project, fallback="current"):
+    """--project, else the connected project's name (resolved once per process by LazyHandler), else fallback."""
+    return project or ctx.obj.default_project_name or fallback
+
+def _print_page_footer(console, df, limit, offset):
+    """Notes which rows of a --limit/--offset page are shown and, if the page is full, how to get the next one."""
+    if not (limit or offset) or df is None or df.empty: return
+    console.print(f"[dim]Showing rows {offset + 1}–{offset + len(df)}.{f' Next page: --offset {offset + limit}' if limit and len(df) == limit else ''}[/dim]")
+
+def _table_rows(df):
+    """Rows of df as tuples of strings for Table.add_row, with missing values as "".
+
+    Cells are stringified with one vectorized astype(str) pass over each column and handed out by itertuples,
+    instead of calling str() per cell on iterrows' per-row Series.
+    """
+    return df.fillna("").astype(str).itertuples(index=False, name=None)
+
+def _display_df_as_table(console, df, title="", show_all=False):
     if df is None:
         console.print("[yellow]No data to display.[/yellow]")
         return
@@ -26,18 +55,114 @@ def _display_df_as_table(console, df, title=""):
         console.print(f"[yellow]{title if title else 'Result'} is empty.[/yellow]")
         return
 
+    if len(df) > _MAX_PRETTY_ROWS:
+        shown_df = df if show_all else df.head(_MAX_PRETTY_ROWS)
+        console.print(f"[dim]{title + ': ' if title else ''}{len(df)} rows, shown as plain text.[/dim]")
+        console.print(shown_df.fillna("").to_string(index=False), markup=False, highlight=False)
+        if not show_all:
+            console.print(f"[dim](truncated, {len(df) - _MAX_PRETTY_ROWS} rows hidden — use --all)[/dim]")
+        return
+
     table = Table(title=title if title else None, show_header=True, header_style="bold magenta", show_lines=True)
-    for col in df.columns:
+    for col in df.columns.tolist():
         table.add_column(str(col))
-    for _, row in df.iterrows():
-        table.add_row(*(str(x) for x in row))
+    for row in _table_rows(df):
+        table.add_row(*row)
     console.print(table)
 
+def _split_sql_statements(sql):
+    """
+    Splits SQL text on top-level semicolons, in one pass.
+
+    Semicolons inside '...', "..." or `...` quotes (with '' and backslash escapes) don't end a statement.
+    -- and /* */ comments are removed, since create_job re-joins the statements with semicolons and a
+    trailing line comment would swallow them. Chunks without any SQL left are dropped.
+    """
+    statements, parts, has_code = [], [], False
+    i, n, segment_start = 0, len(sql), 0
+    while i < n:
+        ch = sql[i]
+        if ch in "'\"`":
+            i += 1
+            while i < n:
+                if sql[i] == ch:
+                    if i + 1 < n and sql[i + 1] == ch: i += 2; continue # Doubled quote is an escaped quote
+                    break
+                i += 2 if sql[i] == '\\' and ch != '`' else 1
+            has_code = True
+        elif sql.startswith('--', i) or sql.startswith('/*', i):
+            parts.append(sql[segment_start:i])
+            if sql[i] == '-':
+                comment_end = sql.find('\n', i)
+                i = n if comment_end == -1 else comment_end # Keep the newline itself
+            else:
+                comment_end = sql.find('*/', i + 2)
+                i = n if comment_end == -1 else comment_end + 2
+            parts.append(' ')
+            segment_start = i
+            continue
+        elif ch == ';':
+            parts.append(sql[segment_start:i])
+            if has_code: statements.append(''.join(parts).strip())
+            parts, has_code, segment_start = [], False, i + 1
+        elif not ch.isspace():
+            has_code = True
+        i += 1
+    parts.append(sql[segment_start:])
+    if has_code: statements.append(''.join(parts).strip())
+    return statements
+
+# SQL larger than this is echoed as plain text: Pygments' regex lexer gets slow on big multi-statement inputs
+_MAX_HIGHLIGHT_SQL_CHARS = 4096
+_PLAIN_SQL_ECHO_LINES = 40
+
+def _statements_echo(statements):
+    """Renderable echo of a job's statements: highlighted when small, otherwise the first lines as plain text."""
+    sql_text = ";\n".join(statements)
+    if len(sql_text) <= _MAX_HIGHLIGHT_SQL_CHARS:
+        from rich.syntax import Syntax # Deferred: pulls in pygments, which only the statement echo needs
+        return Syntax(sql_text, "sql", theme="dracula", line_numbers=True, word_wrap=False)
+    from rich.text import Text
+    lines = sql_text.splitlines()
+    echo = Text("\n".join(lines[:_PLAIN_SQL_ECHO_LINES]))
+    if len(lines) > _PLAIN_SQL_ECHO_LINES:
+        echo.append(f"\n(… {len(lines) - _PLAIN_SQL_ECHO_LINES} more lines …)", style="dim")
+    return echo
+
+def _report_created_job(console, job_name, project, status_df):
+    """Confirms a new job and shows the status row fetched right after creating it."""
+    console.print(f"[green]:heavy_check_mark: Job '[cyan]{job_name}[/cyan]' created successfully.[/green]")
+    if not status_df.empty:
+        _display_df_as_table(console, status_df, title=f"Status for Job: {f'{project}.' if project else ''}{job_name}")
+
+def _wait_for_first_runs(handler, job_names, project_name, interval, timeout):
+    """Polls log.jobs_history until every job has finished a run. Returns {job_name: error or None}; jobs still
+    running at the timeout are left out. Returns None if the history can't be read (the handler has already
+    said why). Each tick is a single `name IN (...)` query, however many jobs are watched."""
+    import pandas as pd # Deferred: only --wait needs it
+    finished = {}
+    deadline = time.monotonic() + timeout
+    while True:
+        pending = [name for name in job_names if name not in finished]
+        history_df = handler.get_jobs_history(pending, project_name)
+        if history_df is None:
+            return None # Unreadable history won't fix itself between ticks
+        if not history_df.empty:
+            cols = {str(col).lower(): col for col in history_df.columns}
+            if 'name' in cols:
+                done_df = history_df[history_df[cols['run_end']].notna()] if 'run_end' in cols else history_df
+                errors = done_df[cols['error']] if 'error' in cols else pd.Series(None, index=done_df.index)
+                for name, error in zip(done_df[cols['name']], errors):
+                    finished.setdefault(name, error if pd.notna(error) and str(error).strip() else None)
+        if all(name in finished for name in job_names) or time.monotonic() + interval > deadline:
+            return finished
+        time.sleep(interval)
+
 @job_group.command('update-hn-refresh')
 @click.argument('job_name') # Removed help
 @click.option('--hn-datasource', default='hackernews', show_default=True, help="The name of the HackerNews datasource in MindsDB that this job will refresh.")
 @click.option('--schedule', default='EVERY 1 day', show_default=True, help="Schedule interval for the job, using MindsDB's `SCHEDULE` syntax (e.g., 'EVERY 1 hour', 'EVERY 1 day at 03:00').")
-@click.option('--project', help="MindsDB project where the job should be created. Defaults to the currently connected project.")
+@common_project_option(help=_CREATE_PROJECT_HELP)
 @click.pass_context
 def job_update_hackernews_db(ctx, job_name, hn_datasource, schedule, project):
     """
@@ -53,58 +178,120 @@ def job_update_hackernews_db(ctx, job_name, hn_datasource, schedule, project):
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    console.print(f"Creating job '[cyan]{job_name}[/cyan]' to refresh HackerNews datasource '[cyan]{hn_datasource}[/cyan]'...")
-    console.print(f"  Schedule: [yellow]{schedule}[/yellow]")
+    if not ctx.obj.quiet:
+        console.print(f"Creating job '[cyan]{job_name}[/cyan]' to refresh HackerNews datasource '[cyan]{hn_datasource}[/cyan]'...",
+                      f"  Schedule: [yellow]{schedule}[/yellow]", sep="\n") # One print call: rendered and written to stdout once
 
     with Status(f"Submitting job '[cyan]{job_name}[/cyan]'...", console=console):
-        success = handler.update_hackernews_db(
+        status_df = handler.update_hackernews_db(
             job_name=job_name, hn_datasource=hn_datasource,
-            schedule_interval=schedule, project_name=project
+            schedule_interval=schedule, project_name=project, fetch_status=True
         )
-    if success:
-        console.print(f"[green]:heavy_check_mark: Job '[cyan]{job_name}[/cyan]' created successfully.[/green]")
-        console.print(f"  Check status with: [bold]kleos job status {job_name}{f' --project {project}' if project else ''}[/bold]")
+    if status_df is not None:
+        _report_created_job(console, job_name, project, status_df)
     else:
         console.print(f"[red]:x: Failed to create job '[cyan]{job_name}[/cyan]'. Check logs for details.[/red]")
 
+@job_group.command('create-hn-ingest')
+@click.argument('job_name')
+@click.argument('kb_name')
+@click.option('--hn-table', 'hn_tables', multiple=True, required=True, type=click.Choice(['stories', 'comments', 'hnstories']), help="HackerNews table to ingest into the KB. Repeat to ingest several tables with the same job.")
+@click.option('--hn-datasource', default='hackernews', show_default=True, help="The name of the HackerNews datasource in MindsDB to read from.")
+@click.option('--schedule', default='EVERY 1 day', show_default=True, help="Schedule interval for the job, using MindsDB's `SCHEDULE` syntax (e.g., 'EVERY 1 hour', 'EVERY 1 day at 03:00').")
+@common_project_option(help=_CREATE_PROJECT_HELP)
+@click.option('--wait', is_flag=True, help="After creating the job, poll until its first run has finished and report the result.")
+@click.option('--poll-interval', type=click.IntRange(min=1), default=5, show_default=True, help="Seconds between status checks with --wait.")
+@click.option('--wait-timeout', type=click.IntRange(min=1), default=600, show_default=True, help="Give up waiting after this many seconds.")
+@click.pass_context
+def job_create_hn_ingest(ctx, job_name, kb_name, hn_tables, hn_datasource, schedule, project, wait, poll_interval, wait_timeout):
+    """
+    Creates a MindsDB Job that periodically ingests new HackerNews rows into a Knowledge Base.
+
+    Every --hn-table becomes one `INSERT INTO kb_name ... SELECT ... LATEST` statement
+    in the same job, so seeding a KB from several tables takes one job and a single
+    round trip to MindsDB instead of one per table.
+
+    With --wait, the command polls `log.jobs_history` until the job's first run has
+    finished instead of leaving you to re-run `kleos job status` by hand.
+
+    Example:
+    `kleos job create-hn-ingest hn_kb_ingest my_hn_kb --hn-table stories --hn-table comments --schedule "EVERY 1 hour"`
+    """
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    hn_tables = list(dict.fromkeys(hn_tables))
+    statements = [handler.build_hn_ingest_sql(kb_name, hn_datasource, hn_table) for hn_table in hn_tables]
+    if not ctx.obj.quiet:
+        console.print(f"Creating job '[cyan]{job_name}[/cyan]' to ingest [cyan]{', '.join(hn_tables)}[/cyan] from '[cyan]{hn_datasource}[/cyan]' into KB '[cyan]{kb_name}[/cyan]'...",
+                      f"  Schedule: [yellow]{schedule}[/yellow]", sep="\n")
+
+    with Status(f"Submitting job '[cyan]{job_name}[/cyan]'...", console=console):
+        status_df = handler.create_job_and_fetch(job_name=job_name, statements=statements, project_name=project, schedule_interval=schedule)
+    if status_df is None:
+        console.print(f"[red]:x: Failed to create job '[cyan]{job_name}[/cyan]'. Check logs for details.[/red]")
+        return
+    _report_created_job(console, job_name, project, status_df)
+    if not wait: return
+
+    effective_project = _resolve_project(ctx, project, fallback="mindsdb")
+    with Status(f"Waiting for the first run of job '[cyan]{job_name}[/cyan]'...", console=console):
+        finished = _wait_for_first_runs(handler, [job_name], effective_project, poll_interval, wait_timeout)
+    if finished is None:
+        console.print(f"[yellow]Can't wait for job '[cyan]{job_name}[/cyan]': its run history is not readable. Check later with: [bold]kleos job history {job_name}[/bold][/yellow]")
+    elif job_name not in finished:
+        console.print(f"[yellow]Job '[cyan]{job_name}[/cyan]' has not finished a run after {wait_timeout}s. Check later with: [bold]kleos job history {job_name}[/bold][/yellow]")
+    elif finished[job_name]:
+        console.print(f"[red]:x: First run of job '[cyan]{job_name}[/cyan]' failed: {finished[job_name]}[/red]")
+    else:
+        console.print(f"[green]:heavy_check_mark: First run of job '[cyan]{job_name}[/cyan]' completed.[/green]")
+
 @job_group.command('list')
-@click.option('--project', help="Filter jobs by a specific MindsDB project name. If omitted, lists jobs from the currently connected project.")
+@common_project_option(help="Filter jobs by a specific MindsDB project name. If omitted, lists jobs from the currently connected project.")
+@click.option('--limit', type=click.IntRange(min=1), help="Fetch one page of at most this many jobs, ordered by name. If omitted, every job is listed.")
+@click.option('--offset', default=0, show_default=True, type=click.IntRange(min=0), help="Number of jobs to skip, for fetching the next page.")
+@click.option('--all', 'show_all', is_flag=True, help=f"Print every row. Otherwise listings over {_MAX_PRETTY_ROWS} rows are cut off.")
 @click.pass_context
-def job_list(ctx, project):
+def job_list(ctx, project, limit, offset, show_all):
     """
     Lists all MindsDB jobs in a specified project or the current project.
 
     Displays information such as job name, creation date, schedule, status, and the next run time.
+    Every job is listed unless --limit or --offset asks for one page (ordered by name); a footer then shows the next --offset.
+    Listings longer than 500 rows are printed as plain text and cut off unless --all is given.
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project = project if project else handler.project.name if handler.project else "current"
+    effective_project = _resolve_project(ctx, project)
     with Status(f"Fetching jobs from project '[cyan]{effective_project}[/cyan]'...", console=console):
-        jobs_df = handler.list_jobs(project_name=project)
+        jobs_df = handler.list_jobs(project_name=project, limit=limit, offset=offset)
 
     if jobs_df is not None and not jobs_df.empty:
-        _display_df_as_table(console, jobs_df, title=f"Jobs in Project: {effective_project}")
+        _display_df_as_table(console, jobs_df, title=f"Jobs in Project: {effective_project}", show_all=show_all)
+        _print_page_footer(console, jobs_df, limit, offset)
     elif jobs_df is not None: # Empty DataFrame
         console.print(f"[yellow]No jobs found in project '[cyan]{effective_project}[/cyan]'.[/yellow]")
     # Error already printed by handler if jobs_df is None
 
 @job_group.command('status')
 @click.argument('job_name') # Removed help
-@click.option('--project', default=None, help="MindsDB project where the job is located. Defaults to the currently connected project.")
+@common_project_option()
+@click.option('--no-cache', is_flag=True, help="Always query MindsDB instead of reusing a status fetched in the last 15 seconds.")
 @click.pass_context
-def job_status(ctx, job_name, project):
+def job_status(ctx, job_name, project, no_cache):
     """
     Get the current status and details of a specific MindsDB job.
 
     This includes information like the last execution time, next run time, and current status (e.g., active, inactive, error).
+    The status is reused for 15 seconds (e.g. by `job logs` or through the daemon); pass --no-cache to force a fresh lookup.
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project = project if project else handler.project.name if handler.project else "current"
+    effective_project = _resolve_project(ctx, project)
     with Status(f"Getting status for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'...", console=console):
-        status_df = handler.get_job_status(job_name=job_name, project_name=effective_project)
+        status_df = handler.get_job_status(job_name=job_name, project_name=effective_project, use_cache=not no_cache)
 
     if status_df is not None and not status_df.empty:
         _display_df_as_table(console, status_df, title=f"Status for Job: {effective_project}.{job_name}")
@@ -112,26 +299,85 @@ def job_status(ctx, job_name, project):
         console.print(f"[yellow]Job '[cyan]{job_name}[/cyan]' not found in project '[cyan]{effective_project}[/cyan]'.[/yellow]")
     # Error already printed by handler if status_df is None
 
+@job_group.command('status-many')
+@click.argument('job_names', nargs=-1, required=True)
+@common_project_option(help=_MANY_PROJECT_HELP)
+@click.pass_context
+def job_status_many(ctx, job_names, project):
+    """
+    Get the status of several MindsDB jobs at once, in a single table.
+
+    All jobs are looked up with one `WHERE name IN (...)` query, so checking N
+    jobs takes a single round trip to MindsDB.
+
+    Example:
+    `kleos job status-many hn_kb_ingest daily_hackernews_refresh my_nightly_ingest`
+    """
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    effective_project = _resolve_project(ctx, project)
+    job_names = list(dict.fromkeys(job_names))
+    with Status(f"Getting status for {len(job_names)} job(s) in project '[cyan]{effective_project}[/cyan]'...", console=console):
+        status_df = handler.get_jobs_status_bulk(job_names, project_name=effective_project)
+    if status_df is None: return # Error already printed by handler
+
+    name_col = next((col for col in status_df.columns if str(col).lower() == 'name'), None)
+    found = set(status_df[name_col].astype(str).str.lower()) if name_col is not None else set()
+    missing = [name for name in job_names if name.lower() not in found]
+    if not status_df.empty:
+        _display_df_as_table(console, status_df, title=f"Job Status in Project: {effective_project}")
+    if missing:
+        console.print(f"[yellow]Not found in project '[cyan]{effective_project}[/cyan]': {', '.join(missing)}[/yellow]")
+
 @job_group.command('history')
 @click.argument('job_name') # Removed help
-@click.option('--project', default=None, help="MindsDB project where the job is located. Defaults to the currently connected project. History is typically in the 'log' database.")
+@common_project_option(help="MindsDB project where the job is located. Defaults to the currently connected project. History is typically in the 'log' database.")
+@click.option('--limit', default=100, show_default=True, type=click.IntRange(min=0), help="Maximum number of runs to fetch from MindsDB (0 = no limit).")
+@click.option('--offset', default=0, show_default=True, type=click.IntRange(min=0), help="Number of runs to skip, for fetching the next page.")
+@click.option('--all', 'show_all', is_flag=True, help=f"Print every row. Otherwise histories over {_MAX_PRETTY_ROWS} rows are cut off.")
+@click.option('--stream', is_flag=True, help="Fetch the whole history page by page and add each page to the table as it arrives. Ignores --limit/--offset.")
+@click.option('--chunk-size', default=1000, show_default=True, type=click.IntRange(min=1), help="Rows fetched per page with --stream.")
 @click.pass_context
-def job_history(ctx, job_name, project):
+def job_history(ctx, job_name, project, limit, offset, show_all, stream, chunk_size):
     """
     Get the execution history of a specific MindsDB job.
 
     Shows records of past job runs, including start time, end time, status, and any error messages.
     Note: Job history is often stored in a 'log.jobs_history' table which might require specific permissions or configuration in MindsDB to access.
+    Only the latest --limit runs (default 100) are fetched, newest first; use --offset for older ones.
+    Histories longer than 500 rows are printed as plain text and cut off unless --all is given.
+    With --stream, the full history is fetched in pages and shown as it arrives, keeping only one page in memory.
     """
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project = project if project else handler.project.name if handler.project else "current"
+    effective_project = _resolve_project(ctx, project)
+    if stream:
+        from rich.live import Live
+        table = Table(title=f"Execution History for Job: {effective_project}.{job_name}", show_header=True, header_style="bold magenta", show_lines=True)
+        rows_shown = 0
+        try:
+            with Live(table, console=console, refresh_per_second=4, vertical_overflow="visible"):
+                for history_df in handler.iter_job_history(job_name, project_name=effective_project, batch_size=chunk_size):
+                    if not table.columns:
+                        for col in history_df.columns.tolist(): table.add_column(str(col))
+                    for row in _table_rows(history_df):
+                        table.add_row(*row)
+                    rows_shown += len(history_df)
+        except Exception as e:
+            console.print(f"[yellow]Could not get job history for '{job_name}' (table 'log.jobs_history' might be inaccessible or empty): {str(e)}[/yellow]")
+            return
+        if rows_shown == 0:
+            console.print(f"[yellow]No execution history found for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'.[/yellow]")
+        return
+
     with Status(f"Getting history for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'...", console=console):
-        history_df = handler.get_job_history(job_name=job_name, project_name=effective_project)
+        history_df = handler.get_job_history(job_name=job_name, project_name=effective_project, limit=limit, offset=offset)
 
     if history_df is not None and not history_df.empty:
-        _display_df_as_table(console, history_df, title=f"Execution History for Job: {effective_project}.{job_name}")
+        _display_df_as_table(console, history_df, title=f"Execution History for Job: {effective_project}.{job_name}", show_all=show_all)
+        _print_page_footer(console, history_df, limit, offset)
     elif history_df is not None: # Empty DataFrame
         console.print(f"[yellow]No execution history found for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'.[/yellow]")
     # Error/warning already printed by handler if history_df is None or log table inaccessible
@@ -139,7 +385,7 @@ def job_history(ctx, job_name, project):
 @job_group.command('create')
 @click.argument('job_name') # Removed help
 @click.argument('sql_statements') # Removed help
-@click.option('--project', help="MindsDB project where the job should be created. Defaults to the currently connected project.")
+@common_project_option(help=_CREATE_PROJECT_HELP)
 @click.option('--schedule', help="Schedule interval for the job, using MindsDB's `SCHEDULE` syntax (e.g., 'EVERY 1 hour', 'EVERY MONDAY AT 09:00').")
 @click.option('--start-date', help="Job start date/time. Format: 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'.")
 @click.option('--end-date', help="Job end date/time. Format: 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'.")
@@ -151,7 +397,8 @@ def job_create_generic(ctx, job_name, sql_statements, project, schedule, start_d
 
     Allows for flexible automation of tasks using SQL.
     SQL_STATEMENTS should be a string containing one or more SQL commands,
-    separated by semicolons.
+    separated by semicolons. Semicolons inside quoted strings or comments
+    don't split a statement.
 
     Example:
     `kleos job create my_nightly_ingest "INSERT INTO main_table SELECT * FROM staging_table WHERE date = CURRENT_DATE; DELETE FROM staging_table;" --schedule "EVERY 1 day at 01:00"`
@@ -159,53 +406,54 @@ def job_create_generic(ctx, job_name, sql_statements, project, schedule, start_d
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    statements = [stmt.strip() for stmt in sql_statements.split(';') if stmt.strip()]
+    statements = _split_sql_statements(sql_statements)
     if not statements:
         console.print("[red]Error: No SQL statements provided.[/red]")
         return
 
-    console.print(f"Creating job '[cyan]{job_name}[/cyan]' with {len(statements)} SQL statement(s):")
-    console.print(Syntax(";\n".join(statements), "sql", theme="dracula", line_numbers=True))
-    if schedule: console.print(f"  Schedule: [yellow]{schedule}[/yellow]")
-    if start_date: console.print(f"  Start Date: [yellow]{start_date}[/yellow]")
-    if end_date: console.print(f"  End Date: [yellow]{end_date}[/yellow]")
-    if if_condition: console.print(f"  Condition: [yellow]{if_condition}[/yellow]")
+    if not ctx.obj.quiet:
+        # The summary is collected and printed in one call, so it's rendered and written to stdout once
+        summary = [f"Creating job '[cyan]{job_name}[/cyan]' with {len(statements)} SQL statement(s):", _statements_echo(statements)]
+        if schedule: summary.append(f"  Schedule: [yellow]{schedule}[/yellow]")
+        if start_date: summary.append(f"  Start Date: [yellow]{start_date}[/yellow]")
+        if end_date: summary.append(f"  End Date: [yellow]{end_date}[/yellow]")
+        if if_condition: summary.append(f"  Condition: [yellow]{if_condition}[/yellow]")
+        console.print(*summary, sep="\n")
     
     with Status(f"Submitting job '[cyan]{job_name}[/cyan]'...", console=console):
-        success = handler.create_job(
+        status_df = handler.create_job_and_fetch(
             job_name=job_name, statements=statements, project_name=project,
             start_date=start_date, end_date=end_date,
             schedule_interval=schedule, if_condition=if_condition
         )
-    if success:
-        console.print(f"[green]:heavy_check_mark: Job '[cyan]{job_name}[/cyan]' created successfully.[/green]")
-        console.print(f"  Check status with: [bold]kleos job status {job_name}{f' --project {project}' if project else ''}[/bold]")
+    if status_df is not None:
+        _report_created_job(console, job_name, project, status_df)
     else:
         console.print(f"[red]:x: Failed to create job '[cyan]{job_name}[/cyan]'.[/red]")
 
 @job_group.command('logs') # Note: get_job_logs in handler currently returns status
 @click.argument('job_name')
-@click.option('--project', default=None, help="Project name (defaults to connected project).")
+@common_project_option()
 @click.pass_context
 def job_logs(ctx, job_name, project):
     """Get the logs/details of a specific MindsDB job (currently shows status)."""
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project = project if project else handler.project.name if handler.project else "current"
+    effective_project = _resolve_project(ctx, project)
     with Status(f"Getting logs/status for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'...", console=console):
         logs_df = handler.get_job_logs(job_name=job_name, project_name=effective_project) # This calls get_job_status
 
     if logs_df is not None and not logs_df.empty:
         _display_df_as_table(console, logs_df, title=f"Details/Status for Job: {effective_project}.{job_name}")
-        console.print("[dim]Note: For detailed execution logs, query 'log.jobs_history' or specific log tables if available in your MindsDB setup.[/dim]")
+        if not ctx.obj.quiet: console.print("[dim]Note: For detailed execution logs, query 'log.jobs_history' or specific log tables if available in your MindsDB setup.[/dim]")
     elif logs_df is not None: # Empty DataFrame
         console.print(f"[yellow]No logs/status found for job '[cyan]{job_name}[/cyan]' in project '[cyan]{effective_project}[/cyan]'.[/yellow]")
     # Error already printed by handler if logs_df is None
 
 @job_group.command('drop')
 @click.argument('job_name') # Removed help, already good in docstring
-@click.option('--project', help="Project name for the job.")
+@common_project_option()
 @click.confirmation_option(prompt='Are you sure you want to drop this job?')
 @click.pass_context
 def job_drop(ctx, job_name, project):
@@ -213,7 +461,7 @@ def job_drop(ctx, job_name, project):
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    effective_project = project if project else handler.project.name if handler.project else "current"
+    effective_project = _resolve_project(ctx, project)
     with Status(f"Dropping job '[cyan]{job_name}[/cyan]' from project '[cyan]{effective_project}[/cyan]'...", console=console):
         success = handler.drop_job(job_name=job_name, project_name=project)
 
@@ -221,3 +469,32 @@ def job_drop(ctx, job_name, project):
         console.print(f"[green]:heavy_check_mark: Job '[cyan]{job_name}[/cyan]' (from project '[cyan]{effective_project}[/cyan]') dropped successfully.[/green]")
     else:
         console.print(f"[red]:x: Failed to drop job '[cyan]{job_name}[/cyan]' (from project '[cyan]{effective_project}[/cyan]').[/red]")
+
+@job_group.command('drop-many')
+@click.argument('job_names', nargs=-1, required=True)
+@common_project_option(help=_MANY_PROJECT_HELP)
+@click.confirmation_option(prompt='Are you sure you want to drop these jobs?')
+@click.pass_context
+def job_drop_many(ctx, job_names, project):
+    """
+    Drop/delete several MindsDB jobs at once.
+
+    The DROP statements are sent concurrently; results are reported as each drop completes.
+
+    Example:
+    `kleos job drop-many old_ingest old_refresh --yes`
+    """
+    handler, console = get_handler_and_console(ctx)
+    if not handler: return
+
+    effective_project = _resolve_project(ctx, project)
+    failed = 0
+    with Status(f"Dropping {len(job_names)} job(s) from project '[cyan]{effective_project}[/cyan]'...", console=console):
+        for job_name, success in map_concurrently(lambda name: handler.drop_job(job_name=name, project_name=project), job_names, _MAX_JOB_WORKERS):
+            if success:
+                console.print(f"[green]:heavy_check_mark: Job '[cyan]{job_name}[/cyan]' dropped successfully.[/green]")
+            else:
+                failed += 1
+                console.print(f"[red]:x: Failed to drop job '[cyan]{job_name}[/cyan]'.[/red]")
+    if failed:
+        ctx.exit(1)
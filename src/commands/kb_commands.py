@@ -1,20 +1,73 @@
 import click
-import json
-import pandas as pd
-from rich.table import Table
+import functools
+import re
+from types import MappingProxyType
+from rich.table import Table # Table, Status and Text are already imported by .utils, so free here
 from rich.status import Status
-from rich.syntax import Syntax
 from rich.text import Text
-try:
-    from config import config as app_config
-except ImportError:
-    # When installed as package, config might be at different location
-    import sys
-    import os
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-    from config import config as app_config
 from .utils import get_handler_and_console, CONTEXT_SETTINGS # Import from local utils
 
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+def _split_csv(s):
+    """Splits a comma-separated option value (column, KB or table names) in one regex pass, trimming around each comma."""
+    if not s: return None
+    if ',' not in s: return [s.strip()] # Single name, e.g. one --include-tables entry: skip the regex
+    return _CSV_SPLIT.split(s.strip())
+
+_MAX_PRETTY_ROWS = 500 # Larger results are streamed as plain rows rather than laid out as one Rich table
+
+_TSV_ESCAPES = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"}) # KB chunks are free text; keep one row per line
+
+def _stream_df_rows(console, df):
+    """Writes df as tab-separated lines, one row at a time, instead of building the whole table in memory first."""
+    out = console.file
+    out.write("\t".join(str(col).translate(_TSV_ESCAPES) for col in df.columns) + "\n")
+    for row in df.itertuples(index=False, name=None):
+        out.write("\t".join(str(value).translate(_TSV_ESCAPES) for value in row) + "\n")
+    out.flush()
+
+# Smart defaults for `kb ingest` from HackerNews tables. Read-only, so they are shared rather than rebuilt per call.
+_HN_CONTENT_COL = {'stories': 'title', 'comments': 'text'}
+_HN_DEFAULTS = {
+    'stories': MappingProxyType({"story_id": "id", "time": "time", "score": "score", "descendants": "descendants"}),
+    'comments': MappingProxyType({"comment_id": "id", "time": "time", "parent": "parent"}),
+    'hnstories': MappingProxyType({"story_id": "id"}),
+}
+
+@functools.cache
+def _ollama_base_url():
+    # Resolved once per process like ai_commands._gemini_key; the daemon's SIGHUP handler clears it
+    from ..core.config_cache import load_config
+    return getattr(load_config(), 'OLLAMA_BASE_URL', None)
+
+@functools.cache
+def _json_codec():
+    """(loads, pretty_dumps) from orjson if it is installed, else from the stdlib json module. Imported on first use."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads, lambda obj: json.dumps(obj, indent=2)
+    return orjson.loads, lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+def _json_dict_option(console, raw: str, option_name: str):
+    """
+    Parses the JSON dictionary given to option_name. Prints the error and returns None if raw isn't one.
+    Blank values and '{}' give an empty dict without parsing. Every call decodes afresh, so callers own
+    the nested values and may mutate them.
+    """
+    stripped = raw.strip()
+    if stripped in ('', '{}'):
+        return {}
+    try:
+        value = _json_codec()[0](stripped)
+    except ValueError as e: # JSONDecodeError from json or orjson
+        console.print(f"[red]Invalid JSON in {option_name}: {e}[/red]"); return None
+    if not isinstance(value, dict):
+        console.print(f"[red]Error: {option_name} must be a JSON dictionary.[/red]"); return None
+    return value
+
 @click.group('kb', context_settings=CONTEXT_SETTINGS)
 def kb_group():
     """Commands for managing Knowledge Bases (KBs) and associated AI Agents.
@@ -69,34 +122,35 @@ def kb_create(ctx, kb_name, embedding_provider, embedding_model, embedding_base_
     if not handler: return
 
     if embedding_provider == 'ollama' and not embedding_base_url:
-        embedding_base_url = getattr(app_config, 'OLLAMA_BASE_URL', None)
+        embedding_base_url = _ollama_base_url()
         if not embedding_base_url:
             console.print("[yellow]Warning: Embedding provider is ollama, but OLLAMA_BASE_URL is not configured and --embedding-base-url not provided.[/yellow]")
     # Set reranking provider default if reranking model is provided but provider is not
     if reranking_model and not reranking_provider:
         reranking_provider = 'ollama'  # Default to ollama if model is provided but provider is not
-        console.print(f"[yellow]Info: Reranking model '{reranking_model}' provided without provider. Defaulting to 'ollama'.[/yellow]")
+        if not ctx.obj.quiet: console.print(f"[yellow]Info: Reranking model '{reranking_model}' provided without provider. Defaulting to 'ollama'.[/yellow]")
     
     if reranking_provider == 'ollama' and not reranking_base_url and reranking_model:
-        reranking_base_url = getattr(app_config, 'OLLAMA_BASE_URL', None)
+        reranking_base_url = _ollama_base_url()
         if not reranking_base_url:
             console.print("[yellow]Warning: Reranking provider is ollama, but OLLAMA_BASE_URL is not configured and --reranking-base-url not provided.[/yellow]")
 
     # Clear reranking settings if no model is provided
     if not reranking_model: 
         reranking_provider, reranking_base_url, reranking_api_key = None, None, None
-    content_columns_list = [col.strip() for col in content_columns.split(',')] if content_columns else None
-    metadata_columns_list = [col.strip() for col in metadata_columns.split(',')] if metadata_columns else None
-
-    details = Text.assemble(
-        ("KB Name: ", "bold"), (f"{kb_name}\n", "cyan"),
-        ("Embedding: ", "bold"), (f"{embedding_provider}/{embedding_model}\n", "cyan"),
-        ("Reranking: ", "bold"), (f"{reranking_provider}/{reranking_model}\n" if reranking_model else "Not configured\n", "cyan"),
-        ("Content Cols: ", "bold"), (f"{content_columns_list}\n" if content_columns_list else "Default\n", "cyan"),
-        ("Metadata Cols: ", "bold"), (f"{metadata_columns_list}\n" if metadata_columns_list else "Default\n", "cyan"),
-        ("ID Col: ", "bold"), (f"{id_column}\n" if id_column else "Default", "cyan")
-    )
-    console.print(details)
+    content_columns_list = _split_csv(content_columns)
+    metadata_columns_list = _split_csv(metadata_columns)
+
+    if not ctx.obj.quiet:
+        details = Text.assemble(
+            ("KB Name: ", "bold"), (f"{kb_name}\n", "cyan"),
+            ("Embedding: ", "bold"), (f"{embedding_provider}/{embedding_model}\n", "cyan"),
+            ("Reranking: ", "bold"), (f"{reranking_provider}/{reranking_model}\n" if reranking_model else "Not configured\n", "cyan"),
+            ("Content Cols: ", "bold"), (f"{content_columns_list}\n" if content_columns_list else "Default\n", "cyan"),
+            ("Metadata Cols: ", "bold"), (f"{metadata_columns_list}\n" if metadata_columns_list else "Default\n", "cyan"),
+            ("ID Col: ", "bold"), (f"{id_column}\n" if id_column else "Default", "cyan")
+        )
+        console.print(details)
 
     with Status(f"Creating Knowledge Base '[cyan]{kb_name}[/cyan]'...", console=console, spinner="dots2"):
         success = handler.create_knowledge_base(
@@ -108,7 +162,7 @@ def kb_create(ctx, kb_name, embedding_provider, embedding_model, embedding_base_
         )
     if success:
         console.print(f"[green]:heavy_check_mark: Knowledge Base '[cyan]{kb_name}[/cyan]' creation command sent.[/green]")
-        console.print("[dim]Note: KB creation is asynchronous. Check MindsDB logs or list KBs to confirm.[/dim]")
+        if not ctx.obj.quiet: console.print("[dim]Note: KB creation is asynchronous. Check MindsDB logs or list KBs to confirm.[/dim]")
     else:
         console.print(f"[red]:x: Failed to send command to create Knowledge Base '[cyan]{kb_name}[/cyan]'.[/red]")
 
@@ -164,26 +218,21 @@ def kb_ingest(ctx, kb_name, from_hackernews_table, hn_datasource, limit, content
     if not handler: return
     if not from_hackernews_table: console.print("[red]Error: Please specify --from-hackernews <table_name>.[/red]"); return
 
-    if not content_column:
-        if from_hackernews_table == 'stories': content_column = 'title'
-        elif from_hackernews_table == 'comments': content_column = 'text'
-        else: console.print("[red]Error: Please specify --content-column for this table.[/red]"); return
+    content_column = content_column or _HN_CONTENT_COL.get(from_hackernews_table)
+    if not content_column: console.print("[red]Error: Please specify --content-column for this table.[/red]"); return
     
     parsed_metadata_map = None
     if metadata_map:
-        try:
-            parsed_metadata_map = json.loads(metadata_map)
-            if not isinstance(parsed_metadata_map, dict) or not all(isinstance(v, str) for v in parsed_metadata_map.values()):
-                console.print("[red]Error: --metadata-map must be a JSON dictionary with string values (column names).[/red]"); return
-        except Exception as e: console.print(f"[red]Invalid JSON in --metadata-map: {e}[/red]"); return
+        parsed_metadata_map = _json_dict_option(console, metadata_map, '--metadata-map')
+        if parsed_metadata_map is None: return
+        if not all(type(v) is str for v in parsed_metadata_map.values()): # json only ever yields exact str
+            console.print("[red]Error: --metadata-map must be a JSON dictionary with string values (column names).[/red]"); return
     else:
-        if from_hackernews_table == 'stories': parsed_metadata_map = {"story_id": "id", "time": "time", "score": "score", "descendants": "descendants"}
-        elif from_hackernews_table == 'comments': parsed_metadata_map = {"comment_id": "id", "time": "time", "parent": "parent"}
-        elif from_hackernews_table == 'hnstories': parsed_metadata_map = {"story_id": "id"}
-        console.print(f"Using smart defaults for [cyan]{from_hackernews_table}[/cyan]: content='[cyan]{content_column}[/cyan]', metadata=[cyan]{list(parsed_metadata_map.keys()) if parsed_metadata_map else 'None'}[/cyan]")
+        parsed_metadata_map = _HN_DEFAULTS.get(from_hackernews_table)
+        if not ctx.obj.quiet: console.print(f"Using smart defaults for [cyan]{from_hackernews_table}[/cyan]: content='[cyan]{content_column}[/cyan]', metadata=[cyan]{[*parsed_metadata_map] if parsed_metadata_map else 'None'}[/cyan]")
 
     if not handler.get_database_custom_check(hn_datasource):
-        console.print(f"HackerNews datasource '[cyan]{hn_datasource}[/cyan]' not found. Creating it...")
+        if not ctx.obj.quiet: console.print(f"HackerNews datasource '[cyan]{hn_datasource}[/cyan]' not found. Creating it...")
         with Status(f"Creating datasource '{hn_datasource}'...", console=console):
             if not handler.create_hackernews_datasource(ds_name=hn_datasource):
                 console.print(f"[red]:x: Failed to create HackerNews datasource '[cyan]{hn_datasource}[/cyan]'.[/red]")
@@ -219,6 +268,7 @@ def kb_query(ctx, kb_name, query_text, metadata_filters_str, limit):
     The filter supports simple key-value equality and comparison operators
     like `$gt` (greater than), `$gte` (greater than or equal),
     `$lt` (less than), `$lte` (less than or equal) nested within the JSON.
+    Results of more than 500 rows are written as tab-separated text instead of a table.
 
     Examples:
     `kleos kb query my_docs_kb "latest advancements in AI"`
@@ -230,10 +280,8 @@ def kb_query(ctx, kb_name, query_text, metadata_filters_str, limit):
 
     metadata_filters = None
     if metadata_filters_str:
-        try:
-            metadata_filters = json.loads(metadata_filters_str)
-            if not isinstance(metadata_filters, dict): raise ValueError("metadata-filter must be a JSON dictionary.")
-        except Exception as e: console.print(f"[red]Invalid JSON in --metadata-filter: {e}[/red]"); return
+        metadata_filters = _json_dict_option(console, metadata_filters_str, '--metadata-filter')
+        if metadata_filters is None: return
 
     query_info = f"Querying KB '[cyan]{kb_name}[/cyan]' for: \"[italic]{query_text}[/italic]\""
     if metadata_filters: query_info += f" with filters: [yellow]{metadata_filters}[/yellow]"
@@ -242,12 +290,14 @@ def kb_query(ctx, kb_name, query_text, metadata_filters_str, limit):
         results_df = handler.select_from_knowledge_base(kb_name, query_text, metadata_filters=metadata_filters, limit=limit)
 
     if results_df is not None:
-        if not results_df.empty:
+        if len(results_df) > _MAX_PRETTY_ROWS:
+            console.print(f"\n[bold green]Query Results:[/bold green] [dim]{len(results_df)} rows, shown as tab-separated text.[/dim]")
+            _stream_df_rows(console, results_df)
+        elif not results_df.empty:
             console.print("\n[bold green]Query Results:[/bold green]")
-            table = Table(show_header=True, header_style="bold magenta", show_lines=True)
-            for col in results_df.columns: table.add_column(col)
-            for _, row in results_df.iterrows():
-                table.add_row(*(str(x) for x in row))
+            table = Table(*map(str, results_df.columns), show_header=True, header_style="bold magenta", show_lines=True)
+            for row in results_df.itertuples(index=False, name=None):
+                table.add_row(*map(str, row))
             console.print(table)
         else:
             console.print("[yellow]No results found.[/yellow]")
@@ -275,13 +325,11 @@ def kb_list_databases(ctx):
 
     if databases_df is not None and not databases_df.empty:
         console.print("\n[bold green]Available Databases/Datasources:[/bold green]")
-        table = Table(show_header=True, header_style="bold magenta")
-        # Determine column name, common ones are 'Database', 'name', 'NAME'
-        db_col_name = 'name' # Default from newer MindsDB versions
-        if 'Database' in databases_df.columns: db_col_name = 'Database'
-        elif 'NAME' in databases_df.columns: db_col_name = 'NAME'
+        # Determine column name, common ones are 'Database', 'name', 'NAME'; 'name' is the default from newer MindsDB versions
+        columns = set(databases_df.columns)
+        db_col_name = next((col for col in ('Database', 'NAME') if col in columns), 'name')
 
-        table.add_column(db_col_name)
+        table = Table(db_col_name, show_header=True, header_style="bold magenta")
         for db_name in databases_df[db_col_name]: table.add_row(db_name)
         console.print(table)
     else:
@@ -316,17 +364,15 @@ def kb_create_agent(ctx, agent_name, model_name, include_knowledge_bases,
     handler, console = get_handler_and_console(ctx)
     if not handler: return
 
-    include_kb_list = [kb.strip() for kb in include_knowledge_bases.split(',')] if include_knowledge_bases else []
+    include_kb_list = _split_csv(include_knowledge_bases) or []
     if not include_kb_list: console.print("[red]Error: --include-knowledge-bases cannot be empty.[/red]"); return
-    include_tables_list = [table.strip() for table in include_tables.split(',')] if include_tables else None
+    include_tables_list = _split_csv(include_tables)
     parsed_other_params = {}
     if other_params_str:
-        try:
-            parsed_other_params = json.loads(other_params_str)
-            if not isinstance(parsed_other_params, dict): raise ValueError("--other-params must be a JSON dictionary.")
-        except Exception as e: console.print(f"[red]Invalid JSON in --other-params: {e}[/red]"); return
+        parsed_other_params = _json_dict_option(console, other_params_str, '--other-params')
+        if parsed_other_params is None: return
 
-    console.print(f"Attempting to create agent '[cyan]{agent_name}[/cyan]' using model '[cyan]{model_name}[/cyan]'...")
+    if not ctx.obj.quiet: console.print(f"Attempting to create agent '[cyan]{agent_name}[/cyan]' using model '[cyan]{model_name}[/cyan]'...")
     # Further details can be printed here if needed
 
     with Status(f"Creating agent '[cyan]{agent_name}[/cyan]'...", console=console, spinner="material"):
@@ -337,7 +383,7 @@ def kb_create_agent(ctx, agent_name, model_name, include_knowledge_bases,
         )
     if success:
         console.print(f"[green]:heavy_check_mark: Agent '[cyan]{agent_name}[/cyan]' creation command sent.[/green]")
-        console.print("[dim]Note: Agent creation is asynchronous. Check MindsDB logs or status to confirm.[/dim]")
+        if not ctx.obj.quiet: console.print("[dim]Note: Agent creation is asynchronous. Check MindsDB logs or status to confirm.[/dim]")
     else:
         console.print(f"[red]:x: Failed to send command to create agent '[cyan]{agent_name}[/cyan]'.[/red]")
 
@@ -364,7 +410,8 @@ def kb_query_agent(ctx, agent_name, question):
     if response is not None:
         console.print("\n[bold green]Agent Response:[/bold green]")
         if isinstance(response, dict):
-            console.print(Syntax(json.dumps(response, indent=2), "json", theme="dracula", line_numbers=True))
+            from rich.syntax import Syntax # Pulls in pygments; only needed for dict responses
+            console.print(Syntax(_json_codec()[1](response), "json", theme="dracula", line_numbers=True))
         elif isinstance(response, str):
              console.print(response)
         else: # Should ideally be string or dict from handler
@@ -404,6 +451,7 @@ def kb_evaluate(ctx, kb_name, test_table, version,
 
     Test data can be automatically generated from the KB itself or from a custom SQL query.
     Results can be printed to the console or saved to a MindsDB table.
+    Printed results of more than 500 rows are written as tab-separated text instead of a table.
 
     Examples:
     `kleos kb evaluate my_docs_kb --test-table my_project.eval_questions --version doc_id`
@@ -419,11 +467,8 @@ def kb_evaluate(ctx, kb_name, test_table, version,
 
     parsed_llm_other_params = None
     if llm_other_params:
-        try:
-            parsed_llm_other_params = json.loads(llm_other_params)
-            if not isinstance(parsed_llm_other_params, dict):
-                raise ValueError("--llm-other-params must be a valid JSON dictionary.")
-        except Exception as e: console.print(f"[red]Invalid JSON in --llm-other-params: {e}[/red]"); return
+        parsed_llm_other_params = _json_dict_option(console, llm_other_params, '--llm-other-params')
+        if parsed_llm_other_params is None: return
 
     run_evaluation_param = not no_evaluate_flag
 
@@ -447,12 +492,14 @@ def kb_evaluate(ctx, kb_name, test_table, version,
     if results_df is not None:
         action_verb = "Evaluation" if run_evaluation_param else "Data generation"
         console.print(f"[green]:heavy_check_mark: {action_verb} for KB '[cyan]{kb_name}[/cyan]' completed.[/green]")
-        if not results_df.empty:
+        if len(results_df) > _MAX_PRETTY_ROWS:
+            console.print(f"\n[bold green]Results:[/bold green] [dim]{len(results_df)} rows, shown as tab-separated text.[/dim]")
+            _stream_df_rows(console, results_df)
+        elif not results_df.empty:
             console.print("\n[bold green]Results:[/bold green]")
-            table = Table(show_header=True, header_style="bold magenta", show_lines=True)
-            for col in results_df.columns: table.add_column(str(col)) # Ensure col names are strings
-            for _, row in results_df.iterrows():
-                table.add_row(*(str(x) for x in row))
+            table = Table(*map(str, results_df.columns), show_header=True, header_style="bold magenta", show_lines=True) # Ensure col names are strings
+            for row in results_df.itertuples(index=False, name=None):
+                table.add_row(*map(str, row))
             console.print(table)
         elif run_evaluation_param: # Only say this if evaluation was supposed to run
             console.print(f"[yellow]{action_verb} returned no data or results were saved to table '[cyan]{save_to_table}[/cyan]'.[/yellow]")
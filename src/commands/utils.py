@@ -1,9 +1,11 @@
 import click
+import functools
+import importlib
 from rich.console import Console
 from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
-from rich.status import Status # Added for get_handler_and_console if it uses it directly
+from rich.status import Status # Used by LazyHandler while connecting
 
 # Custom Rich Help Formatter
 class RichHelpFormatter(click.HelpFormatter):
@@ -38,39 +40,108 @@ class RichHelpFormatter(click.HelpFormatter):
         self.console.print(table)
         self.write_full_line("")
 
+# Click group that defers importing its subcommand modules until they are dispatched
+class LazyGroup(click.Group):
+    def __init__(self, *args, lazy_subcommands=None, lazy_short_help=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> "dotted.module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+        # Maps command name -> help-listing text, so `--help` can list a lazy command without importing it
+        self.lazy_short_help = lazy_short_help or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_path, attr_name = self.lazy_subcommands[cmd_name].rsplit(':', 1)
+            module = importlib.import_module(module_path)
+            self.commands[cmd_name] = getattr(module, attr_name) # Cache so the import happens once
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max((len(name) for name in names), default=0)
+        rows = []
+        for cmd_name in names:
+            if cmd_name in self.lazy_short_help and cmd_name not in self.commands:
+                rows.append((cmd_name, self.lazy_short_help[cmd_name]))
+                continue
+            cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((cmd_name, cmd.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
 # CONTEXT_SETTINGS should only contain settings directly passed to Context.__init__
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 # RichHelpFormatter class itself is defined above and will be assigned to commands/groups directly.
 
+# Context object shared by all commands; the MindsDB handler is only built and connected on first access
+class LazyHandler:
+    def __init__(self, console):
+        self._handler = None
+        self.console = console
+        self.quiet = False # Set by the global --quiet flag to skip informational output
+        self._connect_failed = False
+
+    @property
+    def console(self):
+        return self._console
+
+    @console.setter
+    def console(self, console):
+        # Kept in step with the connected handler, so its own messages go to the same place
+        self._console = console
+        if self._handler is not None:
+            self._handler.console = console
+
+    @property
+    def handler(self):
+        if self._handler is None and not self._connect_failed:
+            from src.core.mindsdb_handler import MindsDBHandler # Deferred so help/validation paths never import the SDK
+            handler = MindsDBHandler(rich_console=self.console)
+            with Status("Connecting to MindsDB...", console=self.console, spinner="dots"):
+                connected = handler.connect() # connect method now uses handler.console
+            if connected:
+                self._handler = handler
+            else:
+                # Error message is printed by handler.connect() itself using Rich; don't retry on every access
+                self._connect_failed = True
+        return self._handler
+
+    @functools.cached_property
+    def default_project_name(self):
+        # Resolved once per process instead of on every command
+        handler = self.handler
+        return handler.project.name if handler and handler.project else None
+
+def map_concurrently(fn, names, max_workers):
+    """Calls fn(name) for each (deduplicated) name on a thread pool, yielding (name, result) in completion order.
+
+    Used by the multi-model/multi-job commands; the workers share the handler's pooled HTTP session.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed # Deferred: only the multi-item commands need it
+    names = list(dict.fromkeys(names))
+    with ThreadPoolExecutor(max_workers=min(len(names), max_workers)) as executor:
+        futures = {executor.submit(fn, name): name for name in names}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
 # Helper function to get handler and console, and ensure connection
 def get_handler_and_console(ctx):
     obj = ctx.obj
-    # Ensure obj is a dict, which should be guaranteed by main.py's ctx.ensure_object(dict)
+    # Ensure obj is a LazyHandler, which should be guaranteed by main.py's cli callback.
     # However, direct calls or testing might not have it.
-    if not isinstance(obj, dict):
+    if not isinstance(obj, LazyHandler):
         # This case should ideally not happen in normal CLI flow.
-        # Consider raising an error or initializing a default console/handler for robustness if needed.
-        # For now, assume obj is dict as per CLI design.
-        # Fallback console if not found in context for some reason.
         fallback_console = Console()
-        fallback_console.print("[bold red]Critical Error: Context object not found or not a dict in get_handler_and_console.[/bold red]")
-        # Depending on strictness, could raise an exception here.
-        return None, None
-
-
-    handler = obj.get('handler')
-    console = obj.get('console')
-
-    if not handler or not console:
-        # This indicates a programming error if ctx.obj was not set up correctly in main.py
-        local_console = console if console else Console() # Use provided console or a new one
-        local_console.print("[bold red]Critical Error: Handler or Console not found in context object.[/bold red]")
+        fallback_console.print("[bold red]Critical Error: Context object not found or not a LazyHandler in get_handler_and_console.[/bold red]")
         return None, None
 
-
-    if not handler.project: # Check if already connected
-        with Status("Connecting to MindsDB...", console=console, spinner="dots"):
-            if not handler.connect(): # connect method now uses handler.console
-                # Error message is printed by handler.connect() itself using Rich
-                return None, None # Indicate failure
-    return handler, console
+    handler = obj.handler
+    if not handler:
+        return None, None # Indicate failure
+    return handler, obj.console
@@ -0,0 +1,100 @@
+import functools
+import importlib
+import importlib.util
+import os
+import pickle
+import sys
+from types import SimpleNamespace
+
+# Prioritize local configuration from the current working directory
+if os.getcwd() not in sys.path:
+    sys.path.insert(0, os.getcwd())
+
+_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'kleos')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'config.pkl')
+_CACHEABLE_TYPES = (str, int, float, bool, type(None), list, tuple, dict)
+
+def _import_config_module():
+    loaded = sys.modules.get('config.config') or sys.modules.get('src.config.config')
+    if loaded is not None:
+        # Imported earlier in this process (load_config was cleared, e.g. by the daemon's SIGHUP):
+        # a plain import would hand back the stale module object, so re-execute the file
+        return importlib.reload(loaded)
+    try:
+        # Try importing 'config' directly (picks up local config/config.py if cwd is in path)
+        from config import config
+    except ImportError:
+        try:
+            # Try importing from src.config
+            from src.config import config
+        except ImportError:
+            raise ImportError("Could not import 'config'. Please ensure 'config/config.py' exists in your current directory.")
+    return config
+
+def _find_config_source():
+    try:
+        spec = importlib.util.find_spec('config.config')
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec and spec.origin and os.path.isfile(spec.origin) else None
+
+def _source_key(path):
+    # Keyed on path + mtime + size: a stat() is enough to tell whether the snapshot is stale
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+def _current_key(path):
+    try:
+        return _source_key(path)
+    except OSError:
+        return None
+
+def _env_fingerprint(names):
+    # config.py may read these settings from the environment, so their env values are part of the key too
+    return {name: os.environ.get(name) for name in names}
+
+def _read_snapshot(key):
+    try:
+        with open(_CACHE_FILE, 'rb') as f:
+            cached_key, env, values = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key or env != _env_fingerprint(values):
+        return None
+    return values
+
+def _write_snapshot(key, values):
+    try:
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        tmp_file = f"{_CACHE_FILE}.{os.getpid()}.tmp"
+        # The snapshot holds credentials (MindsDB password, API keys), so keep it private to the current user
+        with os.fdopen(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            pickle.dump((key, _env_fingerprint(values), values), f)
+        os.replace(tmp_file, _CACHE_FILE) # Atomic, so concurrent CLI runs never read a half-written file
+    except OSError:
+        pass # The cache is an optimization only
+
+@functools.cache
+def load_config():
+    """
+    Returns the Kleos configuration (config/config.py) as a SimpleNamespace.
+
+    The settings are snapshotted to ~/.cache/kleos/config.pkl together with the
+    source file's path, mtime and size; warm runs load the snapshot instead of
+    importing the config module. Editing the file, or changing an environment
+    variable named like one of the settings, invalidates it.
+    """
+    source = _find_config_source()
+    key = _source_key(source) if source else None
+    if key:
+        values = _read_snapshot(key)
+        if values is not None:
+            return SimpleNamespace(**values)
+
+    config = _import_config_module()
+    values = {name: value for name, value in vars(config).items()
+              if name.isupper() and isinstance(value, _CACHEABLE_TYPES)}
+    # Only snapshot if the file is unchanged since the key was taken, so values are never stored under a newer key
+    if key and _current_key(source) == key:
+        _write_snapshot(key, values)
+    return SimpleNamespace(**values)
@@ -1,33 +1,125 @@
 import mindsdb_sdk
-import sys
 import os
 
-# Prioritize local configuration from the current working directory
-if os.getcwd() not in sys.path:
-    sys.path.insert(0, os.getcwd())
-
-try:
-    # Try importing 'config' directly (picks up local config/config.py if cwd is in path)
-    from config import config
-except ImportError:
-    try:
-        # Try relative import
-        from ..config import config
-    except (ImportError, ValueError):
-        try:
-            # Try importing from src.config
-            from src.config import config
-        except ImportError:
-             raise ImportError("Could not import 'config'. Please ensure 'config/config.py' exists in your current directory.")
-import pandas as pd
+from .config_cache import load_config
+
+config = load_config()
 import time
 import json # Ensure json is imported for create_kb_agent
+import re
+from string import Template
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 
 # Use a global console for handler's own print statements, or pass one if preferred
 console = Console()
 
+# Queries that can't be paged with LIMIT/OFFSET: non-SELECTs and queries that already set their own LIMIT
+_UNPAGEABLE_QUERY_RE = re.compile(r'^(?!\s*(select|with)\b)|\blimit\s+\d+(\s*(,|offset)\s*\d+)?\s*$', re.IGNORECASE)
+# Without an ORDER BY, consecutive LIMIT/OFFSET pages aren't guaranteed to be disjoint or complete
+_ORDER_BY_RE = re.compile(r'\border\s+by\b', re.IGNORECASE)
+# Upper bound on pages execute_sql_iter() fetches for one query, in case the server ignores LIMIT/OFFSET
+_MAX_QUERY_PAGES = 100_000
+
+def _strip_sql_comments(query: str) -> str:
+    """Removes -- and /* */ comments outside '...', \"...\" and `...` quotes, so SQL wrapped around the query can't be commented out."""
+    parts, i, n, start = [], 0, len(query), 0
+    while i < n:
+        ch = query[i]
+        if ch in "'\"`":
+            i += 1
+            while i < n:
+                if query[i] == '\\':
+                    i += 2
+                elif query[i] == ch and query.startswith(ch * 2, i):
+                    i += 2 # Doubled quote escape
+                elif query[i] == ch:
+                    break
+                else:
+                    i += 1
+            i += 1
+        elif query.startswith('--', i):
+            parts.append(query[start:i])
+            end = query.find('\n', i)
+            i = start = n if end == -1 else end # Keep the newline
+        elif query.startswith('/*', i):
+            parts.append(query[start:i] + ' ')
+            end = query.find('*/', i + 2)
+            i = start = n if end == -1 else end + 2
+        else:
+            i += 1
+    parts.append(query[start:])
+    return ''.join(parts)
+
+# Size of the HTTP connection pool shared by every handler (override with the MINDSDB_POOL_SIZE env var)
+MINDSDB_POOL_SIZE = int(os.environ.get('MINDSDB_POOL_SIZE', 16))
+
+# Statement skeleton for create_model_from_query(), parsed once at import instead of re-assembled per call
+_CREATE_MODEL_SQL = Template("CREATE MODEL $model_name FROM $project_name ($select_data_query) PREDICT $predict_column $using_statement;")
+
+def _using_clause_part(key, value) -> str:
+    if isinstance(value, str):
+        escaped_value = value.replace("'", "''")
+        return f"{key} = '{escaped_value}'"
+    return f"{key} = {value}" # Numbers and booleans as-is; other types may need more care
+
+def _page_clause(limit, offset) -> str:
+    """LIMIT/OFFSET suffix for a paged query; a falsy limit means no LIMIT."""
+    clause = f" LIMIT {limit}" if limit else ""
+    return clause + (f" OFFSET {offset}" if offset else "")
+
+# Seconds a describe_model() result is reused, so tight status-polling loops (e.g. in daemon mode) don't re-query MindsDB
+DESCRIBE_CACHE_TTL = 3.0
+# Seconds a list_models() result is reused; describe_model() also answers from it while it's younger than DESCRIBE_CACHE_TTL
+LIST_MODELS_CACHE_TTL = 30.0
+# Seconds a get_job_status() result is reused (job status, job logs); creating or dropping the job evicts it
+JOB_STATUS_CACHE_TTL = 15.0
+# Seconds a positive get_database_custom_check() answer is reused; a missing datasource is always re-checked
+DATABASE_EXISTS_CACHE_TTL = 60.0
+
+class _TTLCache:
+    """Small time-based cache: entries expire ttl seconds after being stored; the oldest entry is evicted when full."""
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+
+    def get(self, key, max_age: float = None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        if max_age is not None and now - (expires_at - self.ttl) > max_age:
+            return None # Still valid, but older than this caller accepts
+        return value
+
+    def set(self, key, value):
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key):
+        self._entries.pop(key, None)
+
 class MindsDBHandler:
+    # One pooled adapter per process, so repeated handler constructions reuse open connections
+    _http_adapter = None
+
+    @classmethod
+    def _get_http_adapter(cls) -> HTTPAdapter:
+        if cls._http_adapter is None:
+            cls._http_adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=MINDSDB_POOL_SIZE,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            )
+        return cls._http_adapter
+
     def __init__(self, rich_console: Console = None):
         self.server = None
         self.project = None
@@ -36,6 +128,10 @@ class MindsDBHandler:
         self.mindsdb_user = config.MINDSDB_USER
         self.mindsdb_password = config.MINDSDB_PASSWORD
         self.console = rich_console if rich_console else console # Use passed console or global
+        self._describe_cache = _TTLCache(ttl=DESCRIBE_CACHE_TTL)
+        self._list_models_cache = _TTLCache(ttl=LIST_MODELS_CACHE_TTL, maxsize=32)
+        self._job_status_cache = _TTLCache(ttl=JOB_STATUS_CACHE_TTL)
+        self._database_exists_cache = _TTLCache(ttl=DATABASE_EXISTS_CACHE_TTL)
         # self.console.print(f"MindsDBHandler initialized for [cyan]{self.mindsdb_host}:{self.mindsdb_port}[/cyan]")
 
     def connect(self, suppress_messages: bool = False) -> bool:
@@ -54,6 +150,13 @@ class MindsDBHandler:
             if not self.server:
                 raise ConnectionError("SDK connect returned None server object.")
 
+            # The SDK keeps a requests.Session on its REST client; mount the shared pool on it
+            session = getattr(getattr(self.server, 'api', None), 'session', None)
+            if isinstance(session, requests.Session):
+                adapter = self._get_http_adapter()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+
             self.project = self.server.get_project()
             if not self.project:
                 raise ConnectionError("Failed to get default project from MindsDB server.")
@@ -101,10 +204,39 @@ class MindsDBHandler:
                 self.console.print(f"[red]MindsDB API Error executing query '{query[:50]}...': {error_details}[/red]")
             raise
 
-    def get_database_custom_check(self, ds_name: str) -> bool:
+    def execute_sql_iter(self, query: str, chunk_size: int = 500):
+        """
+        Yields the result of a SELECT query as DataFrames of at most chunk_size rows.
+
+        The MindsDB SQL API returns each query's result in a single response, so rows are
+        paged by appending `LIMIT .. OFFSET ..` to the query itself. Every page re-runs the
+        query (including any model JOIN), and pages are only well-defined for a stable order,
+        so only queries with an ORDER BY are paged. Others (and non-SELECT statements, or
+        ones with their own LIMIT) are executed once and yielded whole.
+        """
+        query = _strip_sql_comments(query).strip().rstrip(';').rstrip()
+        if _UNPAGEABLE_QUERY_RE.search(query) or not _ORDER_BY_RE.search(query):
+            result_df = self.execute_sql(query, suppress_messages=True)
+            if result_df is not None:
+                yield result_df
+            return
+
+        for page in range(_MAX_QUERY_PAGES):
+            chunk_df = self.execute_sql(f"{query} LIMIT {chunk_size} OFFSET {page * chunk_size}", suppress_messages=True)
+            if chunk_df is None:
+                return
+            yield chunk_df
+            if len(chunk_df) > chunk_size:
+                return # LIMIT/OFFSET were ignored and the whole result came back at once
+            if len(chunk_df) < chunk_size: # A short page is the last one
+                return
+
+    def get_database_custom_check(self, ds_name: str, use_cache: bool = True) -> bool:
         if not self.project:
             self.console.print("[yellow]Cannot perform custom database check: No active MindsDB project.[/yellow]")
             return False
+        if use_cache and self._database_exists_cache.get(ds_name):
+            return True
         # self.console.print(f"Custom check: Verifying existence of database '{ds_name}' using SHOW DATABASES.")
         try:
             res_df = self.execute_sql('SHOW DATABASES;', suppress_messages=True)
@@ -121,6 +253,7 @@ class MindsDBHandler:
             databases = res_df[db_column_name].values
             if ds_name in databases:
                 # self.console.print(f"Custom check: Database '{ds_name}' found.");
+                self._database_exists_cache.set(ds_name, True)
                 return True
             else:
                 # self.console.print(f"Custom check: Database '{ds_name}' not found.");
@@ -234,7 +367,7 @@ class MindsDBHandler:
         
         select_columns = [content_column]
         if metadata_columns: select_columns.extend(metadata_columns.values())
-        select_columns_str = ", ".join(list(dict.fromkeys(select_columns))) # Ensure unique and keep order
+        select_columns_str = ", ".join(dict.fromkeys(select_columns)) # Ensure unique and keep order
         
         query = f"INSERT INTO {kb_name} ({select_columns_str}) SELECT {select_columns_str} FROM {source_table}" # Ensure INSERT columns match SELECT
         
@@ -285,18 +418,21 @@ class MindsDBHandler:
             self.console.print(f"[red]Error performing semantic search on KB '{kb_name}': {str(e)}[/red]")
             return None
 
-    def create_mindsdb_job(self, job_name: str, kb_name: str, hn_datasource: str, hn_table_name: str, schedule_interval: str = "every 1 day"):
-        # This specific job creation method might be too specific if we have a generic one.
-        # Consider deprecating or ensuring it uses the generic `create_job` if that's more flexible.
-        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return False
-
+    def build_hn_ingest_sql(self, kb_name: str, hn_datasource: str, hn_table_name: str) -> str:
+        """Returns the INSERT ... SELECT statement that copies the latest rows of a HackerNews table into a KB."""
         if hn_table_name == 'stories': insert_cols, select_cols = "(content, story_id, author)", "title, id, by"
         elif hn_table_name == 'comments': insert_cols, select_cols = "(content, comment_id, author)", "text, id, by"
         else:
             insert_cols, select_cols = "(content, original_id)", "text, id"
             self.console.print(f"[yellow]Warning: Using generic column mapping for job on table {hn_table_name}[/yellow]")
+        return f"INSERT INTO {kb_name} {insert_cols} SELECT {select_cols} FROM {hn_datasource}.{hn_table_name} LATEST"
 
-        job_query_insert = f"INSERT INTO {kb_name} {insert_cols} SELECT {select_cols} FROM {hn_datasource}.{hn_table_name} LATEST"
+    def create_mindsdb_job(self, job_name: str, kb_name: str, hn_datasource: str, hn_table_name: str, schedule_interval: str = "every 1 day"):
+        # This specific job creation method might be too specific if we have a generic one.
+        # Consider deprecating or ensuring it uses the generic `create_job` if that's more flexible.
+        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return False
+
+        job_query_insert = self.build_hn_ingest_sql(kb_name, hn_datasource, hn_table_name)
         full_job_query = f"CREATE JOB {job_name} AS ({job_query_insert}) SCHEDULE {schedule_interval};"
 
         try:
@@ -310,32 +446,67 @@ class MindsDBHandler:
             self.console.print(f"[red]Error creating job '{job_name}': {str(e)}[/red]")
             return False
 
-    def list_models(self, project_name: str = None):
+    def list_models(self, project_name: str = None, use_cache: bool = True):
         if not self.project and not project_name:
             self.console.print("[red]Error: MindsDB connection not established and no project specified.[/red]")
             return None
         target_project = project_name if project_name else self.project.name
         if not target_project: self.console.print("[red]Error: Target project name could not be determined.[/red]"); return None
 
+        if use_cache:
+            cached_df = self._list_models_cache.get(target_project)
+            if cached_df is not None: return cached_df
+        models_df = self._list_models_uncached(target_project)
+        if models_df is not None: # Errors are never cached
+            self._list_models_cache.set(target_project, models_df)
+        return models_df
+
+    def _list_models_uncached(self, target_project: str):
         query = f"SHOW MODELS FROM {target_project};"
         try:
             models_df = self.execute_sql(query, suppress_messages=True)
             if models_df is not None and not models_df.empty:
                 return models_df
             # else: self.console.print(f"No models found in project '{target_project}'.") # Handled by command
+            import pandas as pd # Deferred: only needed to build the empty result
             return pd.DataFrame()
         except Exception as e:
             self.console.print(f"[red]Error listing models from project '{target_project}': {str(e)}[/red]")
             return None
 
-    def describe_model(self, model_name: str, project_name: str = None):
+    def describe_model(self, model_name: str, project_name: str = None, use_cache: bool = True):
         if not self.project and not project_name:
             self.console.print("[red]Error: MindsDB connection not established and no project specified.[/red]")
             return None
         target_project = project_name if project_name else self.project.name
         if not target_project: self.console.print("[red]Error: Target project name could not be determined.[/red]"); return None
 
+        cache_key = (target_project, model_name)
+        if use_cache:
+            cached_df = self._describe_cache.get(cache_key)
+            if cached_df is not None: return cached_df
+            # A recent SHOW MODELS for the project already has this model's row: filter it in-process
+            models_df = self._list_models_cache.get(target_project, max_age=DESCRIBE_CACHE_TTL)
+            name_col = next((col for col in models_df.columns if str(col).lower() == 'name'), None) if models_df is not None else None
+            if name_col is not None:
+                matched_df = models_df[models_df[name_col].astype(str).str.lower().eq(model_name.lower())]
+                if not matched_df.empty: return matched_df
+        description_df = self._describe_model_uncached(model_name, target_project)
+        if description_df is not None: # Errors are never cached
+            self._describe_cache.set(cache_key, description_df)
+        return description_df
+
+    def _describe_model_uncached(self, model_name: str, target_project: str):
         qualified_model_name = f"{target_project}.{model_name}"
+        # Filter server-side first: returns just this model's row instead of leaving the name match to the client
+        escaped_name, escaped_project = model_name.replace("'", "''"), target_project.replace("'", "''")
+        filtered_query = f"SELECT * FROM information_schema.models WHERE LOWER(name) = LOWER('{escaped_name}') AND project = '{escaped_project}';"
+        try:
+            description_df = self.execute_sql(filtered_query, suppress_messages=True)
+            if description_df is not None and not description_df.empty: return description_df
+        except Exception:
+            pass # Older MindsDB versions: fall back to DESCRIBE below
+
         query = f"DESCRIBE {qualified_model_name};"
         try:
             description_df = self.execute_sql(query, suppress_messages=True)
@@ -347,6 +518,7 @@ class MindsDBHandler:
             if description_df_fallback is not None and not description_df_fallback.empty: return description_df_fallback
 
             # self.console.print(f"Model '{model_name}' not found or no description available in project '{target_project}'.") # Handled by command
+            import pandas as pd # Deferred: only needed to build the empty result
             return pd.DataFrame()
         except Exception as e:
             self.console.print(f"[red]Error describing model '{qualified_model_name}': {str(e)}[/red]")
@@ -359,6 +531,8 @@ class MindsDBHandler:
         target_project = project_name if project_name else self.project.name
         if not target_project: self.console.print("[red]Error: Target project name could not be determined.[/red]"); return False
 
+        self._describe_cache.pop((target_project, model_name))
+        self._list_models_cache.pop(target_project)
         qualified_model_name = f"{target_project}.{model_name}"
         query = f"DROP MODEL {qualified_model_name};"
         try:
@@ -380,6 +554,8 @@ class MindsDBHandler:
         target_project = project_name if project_name else self.project.name
         if not target_project: self.console.print("[red]Error: Target project name could not be determined.[/red]"); return False
 
+        self._describe_cache.pop((target_project, model_name))
+        self._list_models_cache.pop(target_project)
         qualified_model_name = f"{target_project}.{model_name}"
         query = f"RETRAIN {qualified_model_name};"
         try:
@@ -397,14 +573,12 @@ class MindsDBHandler:
             self.console.print("[red]Error: MindsDB connection not established.[/red]")
             return False
 
-        using_clause_parts = []
-        for key, value in using_params.items():
-            if isinstance(value, str): escaped_value = value.replace("'", "''"); using_clause_parts.append(f"{key} = '{escaped_value}'")
-            elif isinstance(value, (int, float, bool)): using_clause_parts.append(f"{key} = {value}")
-            else: using_clause_parts.append(f"{key} = {str(value)}") # May need more care for complex types
-        using_statement = f"USING {', '.join(using_clause_parts)}" if using_clause_parts else ""
+        using_statement = f"USING {', '.join(_using_clause_part(key, value) for key, value in using_params.items())}" if using_params else ""
 
-        query = f"CREATE MODEL {model_name} FROM {project_name} ({select_data_query}) PREDICT {predict_column} {using_statement};"
+        self._describe_cache.pop((project_name, model_name))
+        self._list_models_cache.pop(project_name)
+        query = _CREATE_MODEL_SQL.substitute(model_name=model_name, project_name=project_name, select_data_query=select_data_query,
+                                             predict_column=predict_column, using_statement=using_statement)
         try:
             self.execute_sql(query)
             # Verification can be done by describe-model command separately
@@ -486,6 +660,7 @@ class MindsDBHandler:
                    schedule_interval: str = None, if_condition: str = None):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return False
         
+        self._job_status_cache.pop((project_name or self.project.name, job_name))
         job_full_name = f"{project_name}.{job_name}" if project_name else job_name
         statements_str = ";\n    ".join(statements)
         query_parts = [f"CREATE JOB IF NOT EXISTS {job_full_name} (", f"    {statements_str}", ")"]
@@ -506,16 +681,35 @@ class MindsDBHandler:
             self.console.print(f"[red]Error creating job '{job_name}': {str(e)}[/red]")
             return False
 
+    def create_job_and_fetch(self, job_name: str, statements: list, project_name: str = None, **job_options):
+        """
+        Creates a job like create_job() and returns its status row(s), or None if the job could not be created.
+
+        The MindsDB SQL API runs one statement per request, so the status SELECT is a second request on the same
+        pooled session; callers get the status without a separate `kleos job status` run (new process + connection).
+        """
+        if not self.create_job(job_name=job_name, statements=statements, project_name=project_name, **job_options): return None
+        status_df = self.get_job_status(job_name, project_name or self.project.name) # Also seeds the status cache
+        if status_df is None:
+            import pandas as pd # Deferred: only needed to build the empty result
+            return pd.DataFrame() # Created, but the status couldn't be read (error already printed)
+        return status_df
+
     def update_hackernews_db(self, job_name: str, hn_datasource: str = "hackernews",
-                           schedule_interval: str = 'EVERY 1 day', project_name: str = None):
-        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return False
+                           schedule_interval: str = 'EVERY 1 day', project_name: str = None, fetch_status: bool = False):
+        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None if fetch_status else False
         statements = [f"DROP DATABASE IF EXISTS {hn_datasource}", f"CREATE DATABASE {hn_datasource} WITH ENGINE = 'hackernews'"]
-        return self.create_job(job_name=job_name, statements=statements, project_name=project_name, schedule_interval=schedule_interval)
+        create = self.create_job_and_fetch if fetch_status else self.create_job # With fetch_status, returns the status DataFrame
+        return create(job_name=job_name, statements=statements, project_name=project_name, schedule_interval=schedule_interval)
 
-    def list_jobs(self, project_name: str = None):
+    def list_jobs(self, project_name: str = None, limit: int = None, offset: int = 0):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
         try:
-            query = f"SELECT * FROM {project_name}.jobs;" if project_name else "SHOW JOBS;"
+            if limit or offset: # SHOW JOBS can't be paged, so read the current project's jobs table instead
+                # Ordered by name so consecutive --offset pages are disjoint and together complete
+                query = f"SELECT * FROM {project_name or self.project.name}.jobs ORDER BY name{_page_clause(limit, offset)};"
+            else:
+                query = f"SELECT * FROM {project_name}.jobs;" if project_name else "SHOW JOBS;"
             result = self.execute_sql(query, suppress_messages=True)
             # if result is not None and not result.empty: self.console.print("Available jobs:") # Handled by command
             # elif result is not None: self.console.print("No jobs found.") # Handled by command
@@ -524,8 +718,18 @@ class MindsDBHandler:
             self.console.print(f"[red]Error listing jobs: {str(e)}[/red]")
             return None
 
-    def get_job_status(self, job_name: str, project_name: str = 'mindsdb'):
+    def get_job_status(self, job_name: str, project_name: str = 'mindsdb', use_cache: bool = True):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
+        cache_key = (project_name, job_name)
+        if use_cache:
+            cached_df = self._job_status_cache.get(cache_key)
+            if cached_df is not None: return cached_df
+        status_df = self._get_job_status_uncached(job_name, project_name)
+        if status_df is not None: # Errors are never cached
+            self._job_status_cache.set(cache_key, status_df)
+        return status_df
+
+    def _get_job_status_uncached(self, job_name: str, project_name: str):
         try:
             query = f"SELECT * FROM {project_name}.jobs WHERE name = '{job_name}';"
             result = self.execute_sql(query, suppress_messages=True)
@@ -536,10 +740,28 @@ class MindsDBHandler:
             self.console.print(f"[red]Error getting job status for '{job_name}': {str(e)}[/red]")
             return None
 
-    def get_job_history(self, job_name: str, project_name: str = 'mindsdb'):
+    def iter_job_history(self, job_name: str, project_name: str = 'mindsdb', batch_size: int = 1000):
+        """Yields a job's execution history, newest first, as DataFrames of at most batch_size rows (see execute_sql_iter)."""
+        # run_end breaks run_start ties, so consecutive LIMIT/OFFSET pages neither overlap nor skip runs
+        query = f"SELECT * FROM log.jobs_history WHERE project = '{project_name}' AND name = '{job_name}' ORDER BY run_start DESC, run_end DESC"
+        return self.execute_sql_iter(query, chunk_size=batch_size)
+
+    def get_jobs_status_bulk(self, job_names: list, project_name: str = 'mindsdb'):
+        """Status rows of several jobs from one `name IN (...)` query instead of one query per job."""
+        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
+        names_sql = ", ".join(f"'{name.replace("'", "''")}'" for name in job_names)
+        try:
+            query = f"SELECT * FROM {project_name}.jobs WHERE name IN ({names_sql});"
+            return self.execute_sql(query, suppress_messages=True)
+        except Exception as e:
+            self.console.print(f"[red]Error getting job status for {', '.join(job_names)}: {str(e)}[/red]")
+            return None
+
+    def get_job_history(self, job_name: str, project_name: str = 'mindsdb', limit: int = None, offset: int = 0):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
         try:
             query = f"SELECT * FROM log.jobs_history WHERE project = '{project_name}' AND name = '{job_name}'" # Ensure log DB is accessible
+            if limit or offset: query += f" ORDER BY run_start DESC, run_end DESC{_page_clause(limit, offset)}" # Newest runs first, so page 1 is the latest
             result = self.execute_sql(query, suppress_messages=True)
             # if result is not None and not result.empty: self.console.print(f"Job '{job_name}' execution history:") # Handled by command
             # elif result is not None: self.console.print(f"No execution history found for job '{job_name}'.") # Handled by command
@@ -549,6 +771,17 @@ class MindsDBHandler:
             self.console.print(f"[yellow]Could not get job history for '{job_name}' (table 'log.jobs_history' might be inaccessible or empty): {str(e)}[/yellow]")
             return None # Return None on specific error or empty
 
+    def get_jobs_history(self, job_names: list, project_name: str = 'mindsdb'):
+        """Execution history of several jobs in one query (`name IN (...)`), e.g. for polling jobs until they have run."""
+        if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
+        names_sql = ", ".join(f"'{name.replace("'", "''")}'" for name in job_names)
+        try:
+            query = f"SELECT * FROM log.jobs_history WHERE project = '{project_name}' AND name IN ({names_sql});"
+            return self.execute_sql(query, suppress_messages=True)
+        except Exception as e:
+            self.console.print(f"[yellow]Could not get job history for {', '.join(job_names)} (table 'log.jobs_history' might be inaccessible or empty): {str(e)}[/yellow]")
+            return None
+
     def get_job_logs(self, job_name: str, project_name: str = 'mindsdb'):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return None
         # This method is tricky as log tables vary and might not be directly queryable
@@ -559,6 +792,7 @@ class MindsDBHandler:
 
     def drop_job(self, job_name: str, project_name: str = None):
         if not self.project: self.console.print("[red]Error: MindsDB connection not established.[/red]"); return False
+        self._job_status_cache.pop((project_name or self.project.name, job_name))
         job_full_name = f"{project_name}.{job_name}" if project_name else job_name
         query = f"DROP JOB IF EXISTS {job_full_name};"
         try:
@@ -8,14 +8,26 @@ import os
 from rich.table import Table as RichTable # Alias to avoid conflict
 from rich.padding import Padding
 
-from .core.mindsdb_handler import MindsDBHandler
 # from config import config # Config is used by MindsDBHandler, not directly here
 
-from .commands import setup_commands
-from .commands import kb_commands
-from .commands import job_commands
-from .commands import ai_commands
-from .commands.utils import CONTEXT_SETTINGS, RichHelpFormatter
+from .commands.utils import CONTEXT_SETTINGS, RichHelpFormatter, LazyGroup, LazyHandler
+
+# Subcommand groups are imported on first dispatch, see LazyGroup
+_LAZY_SUBCOMMANDS = {
+    'setup': 'src.commands.setup_commands:setup_group',
+    'kb': 'src.commands.kb_commands:kb_group',
+    'job': 'src.commands.job_commands:job_group',
+    'ai': 'src.commands.ai_commands:ai_group',
+    'daemon': 'src.commands.daemon_commands:daemon_group',
+}
+# Listed by `kleos --help` in place of each group's docstring, so the help screen imports no command module
+_LAZY_SHORT_HELP = {
+    'setup': "Commands for initial setup and project configuration.",
+    'kb': "Commands for managing Knowledge Bases (KBs) and AI Agents.",
+    'job': "Commands for managing and monitoring MindsDB Jobs.",
+    'ai': "Commands for managing AI Models (Generative AI Tables).",
+    'daemon': "Commands for running Kleos as a long-lived background daemon.",
+}
 
 
 # Initialize Rich Console
@@ -101,10 +113,12 @@ This CLI fulfills the purpose of MindsDB's Knowledge Base:-
         expand=False
     ))
 
-@click.group(invoke_without_command=True, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_SUBCOMMANDS, lazy_short_help=_LAZY_SHORT_HELP, invoke_without_command=True, context_settings=CONTEXT_SETTINGS)
 @click.version_option(None, "-v", "--version", message="%(prog)s CLI version %(version)s", package_name="kleos")
+@click.option('--via-daemon', is_flag=True, help="Forward the command to a running `kleos daemon`, falling back to running it here.")
+@click.option('-q', '--quiet', is_flag=True, help="Suppress informational output (progress echoes, request summaries and hints) for scripts and daemon use; results, warnings and errors are still shown.")
 @click.pass_context
-def cli(ctx):
+def cli(ctx, via_daemon, quiet):
     """
     Kleos CLI - A powerful toolkit to interact with MindsDB.
 
@@ -112,14 +126,16 @@ def cli(ctx):
 
     Manage Knowledge Bases, AI Agents, AI Models, run AI tasks, and generate reports.
     """
-    ctx.ensure_object(dict)
-    ctx.obj = {'handler': MindsDBHandler(rich_console=console), 'console': console}
+    # Reuse the parent's object in interactive mode so one connection serves every command
+    if not isinstance(ctx.obj, LazyHandler):
+        ctx.obj = LazyHandler(console) # Connects to MindsDB only when a command first needs the handler
+    ctx.obj.quiet = quiet
 
     if ctx.invoked_subcommand is None:
         is_direct_command_or_help = False
         if len(sys.argv) > 1:
             if any(arg in ['--help', '-h', '--version', '-v'] for arg in sys.argv[1:]) or \
-               (len(sys.argv) > 1 and sys.argv[1] in cli.commands): # Check if first arg is a command
+               (len(sys.argv) > 1 and sys.argv[1] in cli.list_commands(ctx)): # Check if first arg is a command
                 is_direct_command_or_help = True
 
         if not is_direct_command_or_help and len(sys.argv) == 1:
@@ -139,11 +155,12 @@ def cli(ctx):
                     import shlex
                     args = shlex.split(command_line)
 
-                    if len(args) == 1 and args[0] in cli.commands and isinstance(cli.commands[args[0]], click.Group):
+                    group_cmd = cli.get_command(ctx, args[0]) if len(args) == 1 else None
+                    if isinstance(group_cmd, click.Group):
                         group_name = args[0]
                         try:
-                            with cli.commands[group_name].make_context(info_name=group_name, args=['--help'], parent=ctx) as group_ctx:
-                                cli.commands[group_name].invoke(group_ctx)
+                            with group_cmd.make_context(info_name=group_name, args=['--help'], parent=ctx) as group_ctx:
+                                group_cmd.invoke(group_ctx)
                         except click.exceptions.Exit:
                             pass
                         except Exception as e_group_help:
@@ -282,10 +299,29 @@ This CLI fulfills the purpose of MindsDB's Knowledge Base:-
         expand=False
     ))
 
-cli.add_command(setup_commands.setup_group)
-cli.add_command(kb_commands.kb_group)
-cli.add_command(job_commands.job_group)
-cli.add_command(ai_commands.ai_group)
+_GLOBAL_FLAGS = ('-q', '--quiet', '--via-daemon')
+
+def _split_global_options(argv):
+    """Splits argv into the leading global flags and the rest, which starts at the subcommand."""
+    index = 0
+    while index < len(argv) and argv[index] in _GLOBAL_FLAGS:
+        index += 1
+    return argv[:index], argv[index:]
+
+def main():
+    """Console entry point. Handles `--via-daemon` before Click so forwarded commands skip in-process dispatch."""
+    global_options, command_args = _split_global_options(sys.argv[1:])
+    # KLEOS_VIA_DAEMON=1 lets scripts opt in once instead of passing the flag to every command
+    if '--via-daemon' in global_options or os.environ.get('KLEOS_VIA_DAEMON') == '1':
+        # Only the global-option position is stripped; a `--via-daemon` inside the command is an argument
+        argv = [arg for arg in global_options if arg != '--via-daemon'] + command_args
+        if command_args and command_args[0] != 'daemon': # `daemon start/stop` always run here, never inside the daemon
+            from .commands.daemon_commands import run_via_daemon
+            exit_code = run_via_daemon(argv)
+            if exit_code is not None:
+                sys.exit(exit_code)
+        sys.argv = [sys.argv[0]] + argv # No daemon listening: run in-process
+    cli(prog_name="kleos")
 
 if __name__ == '__main__':
-    cli(prog_name="kleos")
+    main()